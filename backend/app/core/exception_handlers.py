@@ -9,7 +9,6 @@ from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-import traceback
 from typing import Union
 
 from app.exceptions import (
@@ -22,6 +21,7 @@ from app.exceptions import (
     BadRequestError,
     InternalServerError
 )
+from app.exceptions.domain_exceptions import BaseDomainException, map_domain_exception_to_http_status
 from app.utils.logger import get_logger, build_log_context, sanitize_log_data
 
 logger = get_logger(__name__)
@@ -67,6 +67,39 @@ def setup_exception_handlers(app: FastAPI) -> None:
             headers=exc.headers
         )
     
+    @app.exception_handler(BaseDomainException)
+    async def domain_exception_handler(
+        request: Request,
+        exc: BaseDomainException
+    ) -> JSONResponse:
+        """Handle domain exceptions that routers let propagate."""
+        request_id = getattr(request.state, 'request_id', 'unknown')
+        context = build_log_context(request_id=request_id)
+        status_code = map_domain_exception_to_http_status(exc)
+
+        logger.warning(
+            f"{context}DOMAIN_EXCEPTION: {exc.__class__.__name__} - "
+            f"Message: {sanitize_log_data(str(exc))} | "
+            f"Path: {sanitize_log_data(request.url.path)} | "
+            f"Method: {request.method} | "
+            f"Status: {status_code}"
+        )
+
+        headers = {"WWW-Authenticate": "Bearer"} if status_code == status.HTTP_401_UNAUTHORIZED else None
+        return JSONResponse(
+            status_code=status_code,
+            content={
+                "error": {
+                    "type": exc.__class__.__name__,
+                    "message": str(exc),
+                    "details": getattr(exc, 'details', {}),
+                    "status_code": status_code,
+                    "request_id": request_id
+                }
+            },
+            headers=headers
+        )
+
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(
         request: Request, 
@@ -156,7 +189,8 @@ def setup_exception_handlers(app: FastAPI) -> None:
             f"Path: {sanitize_log_data(request.url.path)} | "
             f"Method: {request.method}"
         )
-        logger.debug(f"{context}UNEXPECTED_ERROR_TRACEBACK: {traceback.format_exc()}")
+        # Lazy: the traceback is only rendered when DEBUG is actually enabled
+        logger.debug("%sUNEXPECTED_ERROR_TRACEBACK", context, exc_info=exc)
         
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -5,13 +5,142 @@ This module provides centralized logging configuration with multiple handlers,
 formatters, and log levels for different components of the application.
 """
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import sys
 
+from app.utils.logger import SanitizeArgsFilter
+
+try:
+    import orjson
+    _orjson_available = True
+except Exception:
+    import json
+    _orjson_available = False
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Structured JSON formatter backed by orjson.
+
+    Builds one dict per record and serializes it with orjson (falling back to
+    stdlib json when orjson is not installed), so messages containing quotes
+    or newlines still produce valid JSON lines.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        record_dict = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            record_dict["exception"] = self.formatException(record.exc_info)
+
+        if _orjson_available:
+            return orjson.dumps(record_dict, default=str).decode()
+        return json.dumps(record_dict, default=str)
+
+
+class _RoutingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that remembers which real handlers its logger owned."""
+
+    def __init__(self, log_queue: queue.SimpleQueue, targets: tuple):
+        super().__init__(log_queue)
+        self.targets = targets
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.queue_targets = self.targets
+        return record
+
+
+class _RoutingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that dispatches each record to its originating logger's handlers."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        for handler in getattr(record, "queue_targets", self.handlers):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+# Shared queue between request-path QueueHandlers and the background listener
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener: Optional[_RoutingQueueListener] = None
+# Whether _log_listener's thread is running; tracked here rather than by
+# peeking at QueueListener internals
+_log_listener_running = False
+_atexit_registered = False
+
+
+def _install_queue_handlers(logger_names) -> None:
+    """
+    Swap the configured handlers of each logger for a single QueueHandler.
+
+    The original handlers are handed to a background QueueListener so that
+    request-path logging is an in-memory enqueue instead of a file/stdout write.
+    """
+    global _log_listener
+
+    stop_log_listener()
+
+    all_handlers = []
+    for name in logger_names:
+        target_logger = logging.getLogger(name)
+        handlers = tuple(target_logger.handlers)
+        if not handlers:
+            continue
+        for handler in handlers:
+            target_logger.removeHandler(handler)
+        queue_handler = _RoutingQueueHandler(_log_queue, handlers)
+        # Must run before QueueHandler.prepare() renders the message
+        queue_handler.addFilter(SanitizeArgsFilter())
+        target_logger.addHandler(queue_handler)
+        all_handlers.extend(h for h in handlers if h not in all_handlers)
+
+    _log_listener = _RoutingQueueListener(_log_queue, *all_handlers, respect_handler_level=True)
+
+
+def start_log_listener() -> None:
+    """Start the background thread that drains the log queue.
+
+    setup_logging() calls this as soon as the queue handlers are installed, so
+    records are drained from the first log call whether or not an ASGI
+    lifespan ever runs (scripts, workers, tests).
+    """
+    global _log_listener_running, _atexit_registered
+
+    if _log_listener is None or _log_listener_running:
+        return
+    _log_listener.start()
+    _log_listener_running = True
+
+    if not _atexit_registered:
+        # Flush whatever is still queued when the interpreter exits
+        atexit.register(stop_log_listener)
+        _atexit_registered = True
+
+
+def stop_log_listener() -> None:
+    """Flush queued records and stop the background log thread."""
+    global _log_listener_running
+
+    if _log_listener is None or not _log_listener_running:
+        return
+    _log_listener.stop()
+    _log_listener_running = False
+
 
 def setup_logging() -> None:
     """
@@ -108,7 +237,7 @@ def setup_logging() -> None:
                 "format": "%(levelname)s - %(message)s"
             },
             "json": {
-                "format": '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "message": "%(message)s", "module": "%(module)s", "function": "%(funcName)s", "line": %(lineno)d}',
+                "()": JsonFormatter,
                 "datefmt": "%Y-%m-%d %H:%M:%S"
             },
             "request": {
@@ -202,6 +331,10 @@ def setup_logging() -> None:
     # Configure logging
     try:
         logging.config.dictConfig(LOGGING_CONFIG)
+
+        # Move handler I/O off the request path and start draining the queue
+        _install_queue_handlers([None, *LOGGING_CONFIG["loggers"].keys()])
+        start_log_listener()
         
         # Print status message
         output_modes = []
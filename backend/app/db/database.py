@@ -1,3 +1,9 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.config import settings
@@ -8,10 +14,28 @@ logger = get_database_logger()
 # Create base class for models
 Base = declarative_base()
 
+# Max seconds a request waits for a pooled connection before failing with 503.
+# This is the engine's pool_timeout, so it bounds every checkout.
+DB_ACQUIRE_TIMEOUT_S = getattr(settings, "DB_ACQUIRE_TIMEOUT_S", None) or 2
+
 # Create async engine
+# The default pool (5 + 10 overflow) exhausts quickly under concurrent load, so
+# size it explicitly; pre-ping drops dead connections, recycle outlives idle
+# timeouts on the server/proxy side.
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=True,  # Set to False in production
+    pool_size=getattr(settings, "DB_POOL_SIZE", None) or 20,
+    max_overflow=getattr(settings, "DB_MAX_OVERFLOW", None) or 40,
+    pool_timeout=DB_ACQUIRE_TIMEOUT_S,
+    pool_pre_ping=True,
+    pool_recycle=getattr(settings, "DB_POOL_RECYCLE_S", None) or 1800,
+    # The asyncpg adapter prepares every statement and keeps an LRU of them per
+    # connection (100 by default); a larger cache lets the repeated list/detail
+    # SELECTs skip the server-side parse/plan round-trip on every pooled connection
+    connect_args={
+        "prepared_statement_cache_size": getattr(settings, "DB_PREPARED_STATEMENT_CACHE_SIZE", None) or 500,
+    },
 )
 
 @log_exception(logger)
@@ -34,6 +58,20 @@ async def init_db():
         logger.error(f"Database initialization failed: {str(e)}")
         raise
 
+@log_exception(logger)
+async def warm_db_pool():
+    """Open pool_size connections concurrently so the first requests don't pay connect cost."""
+    pool_size = getattr(engine.pool, "size", lambda: 1)()
+    logger.info(f"Warming database connection pool with {pool_size} connection(s)...")
+
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Concurrent checkouts force the pool to establish distinct connections
+    await asyncio.gather(*(_ping() for _ in range(pool_size)))
+    logger.info("Database connection pool warmed successfully")
+
 @log_exception(logger)
 async def close_db():
     """Close database connections."""
@@ -46,6 +84,27 @@ async def close_db():
         logger.error(f"Error closing database connections: {str(e)}")
         raise
     
+# synchronous_commit level for transactions that opt in via relax_commit_durability()
+DB_RELAXED_SYNCHRONOUS_COMMIT = getattr(settings, "DB_SYNCHRONOUS_COMMIT", None) or "off"
+
+
+async def relax_commit_durability(session: AsyncSession) -> None:
+    """
+    Let the current transaction's commit return without waiting for the WAL flush.
+
+    Only for goal and goal-catalog writes, which are cheap to redo: a server
+    crash can lose the last few hundred ms of such commits but never corrupts
+    data. Connections keep the server default (on), so auth state such as
+    password changes and reset-token jti/used flags stays durable. The setting
+    is transaction-local and resets on commit or rollback; set
+    DB_SYNCHRONOUS_COMMIT="on" to disable the relaxation.
+    """
+    await session.execute(
+        text("SELECT set_config('synchronous_commit', :level, true)"),
+        {"level": DB_RELAXED_SYNCHRONOUS_COMMIT},
+    )
+
+
 # Create async session factory
 async_session = sessionmaker(
     engine,
@@ -53,12 +112,44 @@ async_session = sessionmaker(
     expire_on_commit=False,
 )
 
+# Request-scoped session installed by db_session_middleware (None outside a request)
+_session_ctx: ContextVar[Optional[AsyncSession]] = ContextVar("db_session", default=None)
+
+
+async def _acquire_connection(session: AsyncSession, session_logger) -> None:
+    """Check out the session's connection, bounded by DB_ACQUIRE_TIMEOUT_S."""
+    try:
+        # Check out the connection up front so pool exhaustion (the engine's
+        # pool_timeout) fails fast as a 503 instead of surfacing mid-handler
+        await session.connection()
+    except PoolTimeoutError:
+        session_logger.error(f"Timed out acquiring database connection after {DB_ACQUIRE_TIMEOUT_S}s")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database is busy, please retry shortly"
+        )
+
+
 async def get_db():
-    """Dependency for getting async DB session."""
+    """Dependency for getting async DB session.
+
+    Inside a request handled by db_session_middleware this hands out the
+    request's shared session (the middleware owns commit/rollback/close);
+    otherwise it opens and manages a session of its own.
+    """
     session_logger = get_database_logger()
+
+    shared = _session_ctx.get()
+    if shared is not None:
+        # db_session_middleware has already checked out its connection
+        yield shared
+        return
+
     session_logger.debug("Creating new database session")
     
     async with async_session() as session:
+        await _acquire_connection(session, session_logger)
+
         try:
             yield session
             await session.commit()
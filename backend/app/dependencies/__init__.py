@@ -6,10 +6,9 @@ This module provides reusable dependency functions for FastAPI routes.
 
 from fastapi import Depends, Query, Path, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from pydantic import BaseModel
 
-from sqlalchemy.future import select
 import logging
 
 # Import auth dependencies for easy access
@@ -27,6 +26,16 @@ from .auth import (
 from app.db.database import get_db
 from app.models.employee import Employee
 from app.exceptions import EntityNotFoundError, ValidationError
+from .services import get_employee_repository
+
+
+async def _get_employee_with_role(db: AsyncSession, employee_id: int) -> Optional[Employee]:
+    """Load an employee by ID together with its role, or None if missing.
+
+    Handlers serialize the employee's role, so it must be loaded here: the
+    async session cannot lazy-load it later.
+    """
+    return await get_employee_repository().get_by_id(db, employee_id)
 
 
 class PaginationParams(BaseModel):
@@ -49,15 +58,24 @@ class SortParams(BaseModel):
         validate_assignment = True
 
 
-def get_pagination_params(
-    skip: int = Query(0, ge=0, description="Number of items to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of items to return")
+# Pagination query parameters with their constraints attached to the type.
+# List handlers can declare `skip: SkipParam = 0, limit: LimitParam = 100`
+# directly: the bounds are checked while parsing the query string, with no
+# dependency call or PaginationParams model per request.
+SkipParam = Annotated[int, Query(ge=0, description="Number of items to skip")]
+LimitParam = Annotated[int, Query(ge=1, le=1000, description="Number of items to return")]
+
+
+async def get_pagination_params(
+    skip: SkipParam = 0,
+    limit: LimitParam = 100
 ) -> PaginationParams:
     """Get pagination parameters from query string."""
-    return PaginationParams(skip=skip, limit=limit)
+    # Already validated by the Query constraints
+    return PaginationParams.model_construct(skip=skip, limit=limit)
 
 
-def get_sort_params(
+async def get_sort_params(
     sort_by: Optional[str] = Query(None, description="Field to sort by"),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order: asc or desc")
 ) -> SortParams:
@@ -93,8 +111,7 @@ async def get_employee_by_id(
         logger.warning(f"Invalid employee_id: {employee_id} - must be positive")
         raise ValidationError("Employee ID must be a positive integer greater than 0")
     
-    result = await db.execute(select(Employee).where(Employee.emp_id == employee_id))
-    employee = result.scalars().first()
+    employee = await _get_employee_with_role(db, employee_id)
     
     if not employee:
         logger.warning(f"Employee not found with ID: {employee_id}")
@@ -104,14 +121,14 @@ async def get_employee_by_id(
     return employee
 
 
-def validate_positive_integer(
+async def validate_positive_integer(
     value: int = Path(..., gt=0)
 ) -> int:
     """Validate that path parameter is a positive integer."""
     return value
 
 
-def validate_employee_id(
+async def validate_employee_id(
     employee_id: int = Path(
         ..., 
         gt=0, 
@@ -138,7 +155,7 @@ def validate_employee_id(
     return employee_id
 
 
-def validate_appraisal_id(
+async def validate_appraisal_id(
     appraisal_id: int = Path(
         ..., 
         gt=0, 
@@ -188,10 +205,7 @@ async def validate_employee_exists(
     role_name: str = "Employee"
 ) -> Employee:
     """Validate that an employee exists and return it."""
-    from sqlalchemy.future import select
-    
-    result = await db.execute(select(Employee).where(Employee.emp_id == employee_id))
-    employee = result.scalars().first()
+    employee = await _get_employee_with_role(db, employee_id)
     
     if not employee:
         raise EntityNotFoundError(role_name, employee_id)
@@ -199,7 +213,7 @@ async def validate_employee_exists(
     return employee
 
 
-def get_search_params(
+async def get_search_params(
     search: Optional[str] = Query(None, min_length=1, max_length=100, description="Search term"),
     status: Optional[bool] = Query(None, description="Filter by status")
 ) -> dict:
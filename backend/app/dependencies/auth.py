@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
 from app.models.employee import Employee
 from app.services.auth_service import AuthService
+from app.dependencies.services import get_auth_service
 from app.exceptions import UnauthorizedError
 from app.constants import ROLE_ADMIN, ROLE_MANAGER_LOWER
 from app.utils.logger import get_logger, build_log_context, sanitize_log_data
@@ -20,16 +21,11 @@ from app.utils.logger import get_logger, build_log_context, sanitize_log_data
 logger = get_logger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(
-    tokenUrl="/api/employees/login",  # Keep existing token URL for compatibility
+    tokenUrl="/api/auth/login",
     description="JWT Bearer token authentication"
 )
 
 
-def get_auth_service() -> AuthService:
-    """Dependency to get auth service instance."""
-    return AuthService()
-
-
 async def get_current_user(
     token: str = Security(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
@@ -77,7 +73,43 @@ async def get_current_user(
         )
 
 
-def get_current_active_user(
+async def get_current_user_id(
+    token: str = Security(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+    auth_service: AuthService = Depends(get_auth_service)
+) -> int:
+    """
+    Dependency to get only the authenticated user's ID.
+
+    Rejects disabled or deleted accounts like `get_current_active_user`, but
+    checks only the employee's (emp_id, emp_status) projection (cached
+    briefly) instead of loading the full row with its role. Use it for
+    endpoints that need nothing but the caller's ID.
+    
+    Raises:
+        HTTPException: If the token is invalid or expired, or the account is inactive
+    """
+    context = build_log_context()
+    
+    try:
+        return await auth_service.get_current_user_id_from_token(db, token)
+    except UnauthorizedError as e:
+        logger.warning(f"{context}AUTH_FAILED: Token validation failed - {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except Exception as e:
+        logger.error(f"{context}AUTH_ERROR: Unexpected error during authentication - {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication failed",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_current_active_user(
     current_user: Employee = Depends(get_current_user)
 ) -> Employee:
     """
@@ -121,7 +153,7 @@ def get_current_active_user(
 
 
 # Role-based dependencies
-def require_manager_role(
+async def require_manager_role(
     current_user: Employee = Depends(get_current_active_user)
 ) -> Employee:
     """Require manager role or higher."""
@@ -151,7 +183,7 @@ def require_manager_role(
         )
 
 
-def require_admin_role(
+async def require_admin_role(
     current_user: Employee = Depends(get_current_active_user)
 ) -> Employee:
     """Require admin role."""
@@ -181,7 +213,7 @@ def require_admin_role(
         )
 
 
-def require_hr_role(
+async def require_hr_role(
     current_user: Employee = Depends(get_current_active_user)
 ) -> Employee:
     """Require HR role (deprecated - HR is not in new role system)."""
@@ -213,7 +245,7 @@ def require_hr_role(
 
 
 # Legacy compatibility - keep the old get_current_manager function
-def get_current_manager(
+async def get_current_manager(
     current_user: Employee = Depends(get_current_active_user)
 ) -> Employee:
     """
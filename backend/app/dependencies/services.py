@@ -0,0 +1,83 @@
+"""
+Service and repository providers for the Performance Management System.
+
+Services and repositories keep no per-request state (the database session is
+passed into every call), so each is created once at import time and the
+`get_*` providers below hand the shared instance to every request. The
+providers are `async def` so FastAPI resolves them inline instead of through
+its threadpool.
+"""
+
+from app.repositories.employee_repository import EmployeeRepository
+from app.services.application_role_service import ApplicationRoleService
+from app.services.appraisal_service import AppraisalService
+from app.services.auth_service import AuthService
+from app.services.employee_service import EmployeeService
+from app.services.goal_service import (
+    AppraisalGoalService,
+    CategoryService,
+    GoalService,
+    GoalTemplateService,
+)
+from app.services.goal_template_header_service import GoalTemplateHeaderService
+
+_AUTH_SERVICE = AuthService()
+_EMPLOYEE_SERVICE = EmployeeService()
+_EMPLOYEE_REPOSITORY = EmployeeRepository()
+_APPLICATION_ROLE_SERVICE = ApplicationRoleService()
+_APPRAISAL_SERVICE = AppraisalService()
+_GOAL_SERVICE = GoalService()
+_GOAL_TEMPLATE_SERVICE = GoalTemplateService()
+_CATEGORY_SERVICE = CategoryService()
+_APPRAISAL_GOAL_SERVICE = AppraisalGoalService()
+_GOAL_TEMPLATE_HEADER_SERVICE = GoalTemplateHeaderService()
+
+
+async def get_auth_service() -> AuthService:
+    """Dependency to get the shared auth service instance."""
+    return _AUTH_SERVICE
+
+
+async def get_employee_service() -> EmployeeService:
+    """Dependency to get the shared employee service instance."""
+    return _EMPLOYEE_SERVICE
+
+
+def get_employee_repository() -> EmployeeRepository:
+    """Return the shared employee repository (for use inside other dependencies)."""
+    return _EMPLOYEE_REPOSITORY
+
+
+async def get_app_role_service() -> ApplicationRoleService:
+    """Dependency to get the shared application role service instance."""
+    return _APPLICATION_ROLE_SERVICE
+
+
+async def get_appraisal_service() -> AppraisalService:
+    """Dependency to get the shared appraisal service instance."""
+    return _APPRAISAL_SERVICE
+
+
+async def get_goal_service() -> GoalService:
+    """Dependency to get the shared goal service instance."""
+    return _GOAL_SERVICE
+
+
+async def get_goal_template_service() -> GoalTemplateService:
+    """Dependency to get the shared goal template service instance."""
+    return _GOAL_TEMPLATE_SERVICE
+
+
+async def get_category_service() -> CategoryService:
+    """Dependency to get the shared category service instance."""
+    return _CATEGORY_SERVICE
+
+
+async def get_appraisal_goal_service() -> AppraisalGoalService:
+    """Dependency to get the shared appraisal goal service instance."""
+    return _APPRAISAL_GOAL_SERVICE
+
+
+async def get_header_service() -> GoalTemplateHeaderService:
+    """Dependency to get the shared goal template header service instance."""
+    return _GOAL_TEMPLATE_HEADER_SERVICE
@@ -0,0 +1,62 @@
+"""
+Request-scoped database session middleware for the Performance Management System.
+
+Opens one AsyncSession per API request and exposes it through a ContextVar,
+so every `Depends(get_db)` in the request (handlers and dependencies alike)
+hands out the same session. Outside this middleware (scripts, non-API routes,
+`dependency_overrides[get_db]` in tests) `get_db` keeps managing its own
+session. The transaction boundary is centralized here: commit on success,
+rollback on error responses or exceptions.
+"""
+
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from starlette.requests import Request
+from starlette.routing import get_route_path
+
+from app.db.database import async_session, _acquire_connection, _session_ctx
+from app.utils.logger import get_database_logger
+
+logger = get_database_logger()
+
+# Only API routes touch the database; static/SPA requests skip the session
+_API_PREFIX = "/api/"
+
+
+async def db_session_middleware(request: Request, call_next):
+    """
+    Wrap an API request in a single database session/transaction.
+
+    The connection is checked out before the handler runs, bounded by
+    DB_ACQUIRE_TIMEOUT_S, so pool exhaustion is a fast 503 on every API route.
+    Responses with status >= 400 (domain and HTTP errors rendered by the
+    exception handlers) are rolled back.
+    """
+    # Match on the path relative to root_path (BASE_PATH), which is what the
+    # routers see; request.url.path still carries the mount prefix
+    if not get_route_path(request.scope).startswith(_API_PREFIX):
+        return await call_next(request)
+
+    async with async_session() as session:
+        try:
+            await _acquire_connection(session, logger)
+        except HTTPException as e:
+            # Raised outside the routers, so the exception handlers never see it
+            return ORJSONResponse({"detail": e.detail}, status_code=e.status_code)
+
+        token = _session_ctx.set(session)
+        try:
+            response = await call_next(request)
+            if response.status_code < 400:
+                await session.commit()
+                logger.debug("Request database session committed successfully")
+            else:
+                await session.rollback()
+                logger.debug(f"Request database session rolled back - Status: {response.status_code}")
+            return response
+        except Exception as e:
+            logger.error(f"Request database session error, rolling back: {str(e)}")
+            await session.rollback()
+            raise
+        finally:
+            _session_ctx.reset(token)
@@ -7,7 +7,6 @@ performance monitoring, and error capturing.
 
 import time
 import uuid
-import traceback
 from typing import Callable
 from starlette.requests import Request
 from starlette.responses import Response
@@ -92,11 +91,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             process_time = time.time() - start_time
             
             # Log request failure
+            # exc_info lets the logging handler render the traceback instead of
+            # formatting it eagerly in the request path
             request_logger.error(
-                f"REQUEST_ERROR - ID: {request_id} | "
-                f"Error: {str(e)} | "
-                f"Duration: {process_time:.4f}s | "
-                f"Traceback: {traceback.format_exc()}"
+                "REQUEST_ERROR - ID: %s | Error: %s | Duration: %.4fs",
+                request_id, e, process_time,
+                exc_info=True
             )
             
             # Re-raise the exception
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from app.db.database import Base
 from app.constants import EMPLOYEES_EMP_ID, ON_DELETE_SET_NULL
 
@@ -22,7 +22,10 @@ class Employee(Base):
     )
     emp_reporting_manager_id = Column(Integer, ForeignKey(EMPLOYEES_EMP_ID, ondelete=ON_DELETE_SET_NULL), nullable=True)
     emp_status = Column(Boolean, default=True)
-    emp_password = Column(String, nullable=True)  # Store hashed password (nullable for SSO users)
+    # Store hashed password (nullable for SSO users). Deferred: it is never
+    # serialized, and login reads it via EmployeeRepository.get_credentials_by_email,
+    # so ordinary Employee queries leave the hash out of the SELECT.
+    emp_password = deferred(Column(String, nullable=True))
     auth_provider = Column(String, nullable=True)  # Authentication provider: 'microsoft', 'password', or None
 
     # Relationships
@@ -131,10 +131,14 @@ class GoalTemplate(Base):
 
     # Relationships
     header = relationship("GoalTemplateHeader", back_populates="goal_templates")
+    # Every template response includes its categories: load them with the
+    # template (one IN query per batch) instead of lazily, which AsyncSession
+    # cannot do during serialization
     categories = relationship(
         "Category",
         secondary=goal_template_categories,
-        back_populates="goal_templates"
+        back_populates="goal_templates",
+        lazy="selectin"
     )
     goals = relationship("Goal", back_populates="template")
 
@@ -160,11 +164,13 @@ class Goal(Base):
     # Legacy single-category relationship (nullable) kept for compatibility
     category = relationship("Category", back_populates=None, foreign_keys=[category_id])
 
-    # Many-to-many categories relationship
+    # Many-to-many categories relationship; eager like GoalTemplate.categories,
+    # since GoalResponse always serializes it
     categories = relationship(
         "Category",
         secondary=goal_categories,
-        back_populates="goals"
+        back_populates="goals",
+        lazy="selectin"
     )
 
     appraisal_goals = relationship(
@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from app.models.application_role import ApplicationRole
+from app.models.employee import Employee
+from app.models.goal import GoalTemplateHeader
 from app.repositories.base_repository import BaseRepository
 from app.exceptions.domain_exceptions import RepositoryException
 from app.utils.logger import get_logger, build_log_context, log_execution_time
@@ -123,7 +125,6 @@ class ApplicationRoleRepository(BaseRepository[ApplicationRole]):
                 return None
 
             # Count employees
-            from app.models.employee import Employee
             employee_count_query = select(func.count(Employee.emp_id)).where(
                 Employee.application_role_id == app_role_id
             )
@@ -131,7 +132,6 @@ class ApplicationRoleRepository(BaseRepository[ApplicationRole]):
             employee_count = employee_count_result.scalar() or 0
 
             # Count template headers
-            from app.models.goal import GoalTemplateHeader
             header_count_query = select(func.count(GoalTemplateHeader.header_id)).where(
                 GoalTemplateHeader.application_role_id == app_role_id
             )
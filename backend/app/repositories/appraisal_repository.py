@@ -11,6 +11,7 @@ from app.models.goal import Goal
 from app.models.employee import Employee
 from app.models.appraisal_type import AppraisalType, AppraisalRange
 from app.repositories.base_repository import BaseRepository
+from app.exceptions.custom_exceptions import InternalServerError
 from app.exceptions.domain_exceptions import RepositoryException
 from app.utils.logger import get_logger, build_log_context, sanitize_log_data, log_execution_time
 
@@ -710,7 +711,6 @@ class AppraisalRepository(BaseRepository[Appraisal]):
                 self.logger.debug(f"{context}REPO_REMOVE_APPRAISAL_GOAL_EXPIRE: Expiring session identity map")
                 await db.run_sync(lambda sync_session: sync_session.expire_all())
             except Exception as e: 
-                from app.exceptions.custom_exceptions import InternalServerError
                 error_msg = f"Failed to expire session after deleting appraisal goal: {e}"
                 self.logger.error(f"{context}REPO_REMOVE_APPRAISAL_GOAL_EXPIRE_ERROR: {error_msg}")
                 raise InternalServerError(error_msg)
@@ -6,11 +6,12 @@ across entities.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, TypeVar, Generic
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, update, delete, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
 from pydantic import BaseModel
 
 from app.exceptions import EntityNotFoundError, ValidationError
@@ -150,7 +151,8 @@ class BaseRepository(ABC, Generic[ModelType]):
         limit: int = 100,
         filters: Optional[List[Any]] = None,
         order_by: Optional[Any] = None,
-        load_relationships: Optional[List[str]] = None
+        load_relationships: Optional[List[str]] = None,
+        options: Optional[List[Any]] = None
     ) -> List[ModelType]:
         """
         Get multiple entities from database with pagination.
@@ -162,6 +164,7 @@ class BaseRepository(ABC, Generic[ModelType]):
             filters: Optional query filters
             order_by: Optional ordering
             load_relationships: Relationships to eager load
+            options: Extra loader options (e.g. selectinload(...), raiseload("*"))
             
         Returns:
             List[ModelType]: List of found entities
@@ -188,6 +191,9 @@ class BaseRepository(ABC, Generic[ModelType]):
                 for rel in load_relationships:
                     query = query.options(selectinload(getattr(self.model, rel)))
 
+            if options:
+                query = query.options(*options)
+
             query = query.offset(skip).limit(limit)
 
             result = await db.execute(query)
@@ -201,6 +207,45 @@ class BaseRepository(ABC, Generic[ModelType]):
             domain_exception = convert_sqlalchemy_error(e, self.entity_name)
             raise domain_exception
 
+    async def stream_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[List[Any]] = None,
+        order_by: Optional[Any] = None,
+        options: Optional[List[Any]] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[ModelType]:
+        """
+        Stream entities from a server-side cursor, `batch_size` rows at a time.
+
+        Same query as `get_multi`, but rows are never collected into a list:
+        eager loads (`options`) run once per batch, so memory is bounded by
+        the batch rather than the page size.
+        """
+        self.logger.debug(f"Streaming multiple {self.entity_name} - skip: {skip}, limit: {limit}")
+        log_database_operation("READ_STREAM", self.entity_name, self.logger)
+
+        query = select(self.model)
+        if filters:
+            query = query.where(and_(*filters))
+        if order_by is not None:
+            query = query.order_by(order_by)
+        if options:
+            query = query.options(*options)
+        query = query.offset(skip).limit(limit).execution_options(yield_per=batch_size)
+
+        try:
+            result = await db.stream_scalars(query)
+        except Exception as e:
+            self.logger.error(f"Database error streaming multiple {self.entity_name}: {str(e)}")
+            raise convert_sqlalchemy_error(e, self.entity_name)
+
+        async for entity in result:
+            yield entity
+
     @log_execution_time()
     async def count(
         self,
@@ -358,6 +403,67 @@ class BaseRepository(ABC, Generic[ModelType]):
             domain_exception = convert_sqlalchemy_error(e, self.entity_name)
             raise domain_exception
 
+    @log_execution_time()
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        entity_id: Any,
+        obj_data: Dict[str, Any]
+    ) -> Optional[ModelType]:
+        """
+        Update an entity by ID without loading it first.
+
+        Issues a single `UPDATE ... WHERE id = :id RETURNING *` and maps the
+        returned row back onto the (possibly already loaded) instance in the
+        identity map. Keys that are not columns of the model are ignored, as
+        in `update`.
+
+        Args:
+            db: Database session
+            entity_id: Primary key of the entity to update
+            obj_data: Updated column values
+
+        Returns:
+            Optional[ModelType]: Updated entity, or None if no row matched
+
+        Raises:
+            ConstraintViolationError: If update violates constraints
+            DatabaseError: For other database errors
+        """
+        self.logger.debug(f"Updating {self.entity_name} by ID: {entity_id}")
+        log_database_operation("UPDATE", self.entity_name, self.logger)
+
+        table = self.model.__table__
+        values = {field: value for field, value in obj_data.items() if field in table.c}
+        if not values:
+            return await self.get_by_id(db, entity_id)
+
+        stmt = (
+            update(self.model)
+            .where(getattr(self.model, self.id_field) == entity_id)
+            .values(**values)
+            .returning(*table.c)
+        )
+
+        try:
+            result = await db.execute(
+                select(self.model).from_statement(stmt).execution_options(populate_existing=True)
+            )
+            db_obj = result.scalars().first()
+
+            if db_obj is not None:
+                self.logger.info(f"Database record updated - {self.entity_name} with ID: {entity_id}")
+            return db_obj
+
+        except Exception as e:
+            try:
+                await db.rollback()
+            except Exception:
+                pass
+
+            self.logger.error(f"Failed to update {self.entity_name} with ID {entity_id}: {str(e)}")
+            raise convert_sqlalchemy_error(e, self.entity_name)
+
     @log_execution_time()
     async def delete(
         self,
@@ -396,6 +502,54 @@ class BaseRepository(ABC, Generic[ModelType]):
             domain_exception = convert_sqlalchemy_error(e, self.entity_name)
             raise domain_exception
 
+    @log_execution_time()
+    async def delete_by_ids(
+        self,
+        db: AsyncSession,
+        entity_ids: List[Any]
+    ) -> int:
+        """
+        Delete every entity whose ID is in `entity_ids` with one statement.
+
+        The IDs are sent as a single array parameter (`id = ANY($1)`), so the
+        statement text, and asyncpg's prepared statement, is the same for any
+        number of IDs. This is a bulk delete: ORM cascades do not run, so it
+        relies on the database's ON DELETE rules for dependent rows.
+
+        Args:
+            db: Database session
+            entity_ids: Primary keys to delete
+
+        Returns:
+            int: Number of rows deleted
+
+        Raises:
+            DatabaseError: For database operation errors
+        """
+        self.logger.debug(f"Bulk deleting {len(entity_ids)} {self.entity_name} records")
+        log_database_operation("DELETE", self.entity_name, self.logger)
+
+        pk = getattr(self.model, self.id_field)
+        stmt = (
+            delete(self.model)
+            .where(pk == any_(bindparam("entity_ids", value=list(entity_ids), type_=ARRAY(pk.type))))
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            result = await db.execute(stmt)
+            self.logger.info(f"Database records deleted - {result.rowcount} {self.entity_name} records")
+            return result.rowcount
+
+        except Exception as e:
+            try:
+                await db.rollback()
+            except Exception:
+                pass
+
+            self.logger.error(f"Database error bulk deleting {self.entity_name}: {str(e)}")
+            raise convert_sqlalchemy_error(e, self.entity_name)
+
     @log_execution_time()
     async def exists(
         self,
@@ -75,10 +75,10 @@ class CategoryRepository(BaseRepository[Category]):
             if not category:
                 self.logger.debug(f"{context}REPO_GET_OR_CREATE_BY_NAME_CREATING: Creating new category - Name: {name}")
                 
+                # The flush fills in the id; name is the only other column
                 category = Category(name=name)
                 db.add(category)
                 await db.flush()
-                await db.refresh(category)
                 
                 self.logger.info(f"{context}REPO_GET_OR_CREATE_BY_NAME_CREATED: Created new category - ID: {category.id}, Name: {name}")
             else:
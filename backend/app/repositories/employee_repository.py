@@ -5,14 +5,18 @@ This module handles all direct database interactions
 for the Employee entity with comprehensive logging.
 """
 
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_
+from sqlalchemy import and_, inspect
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from app.models.employee import Employee
+from app.models.role import Role
 from app.repositories.base_repository import BaseRepository
 from app.exceptions.domain_exceptions import RepositoryException
 from app.utils.logger import get_logger, build_log_context, sanitize_log_data, log_execution_time
@@ -33,6 +37,20 @@ class EmployeeRepository(BaseRepository[Employee]):
     def id_field(self) -> str:
         return "emp_id"
 
+    async def _get_with_role(self, db: AsyncSession, emp_id: int) -> Optional[Employee]:
+        """
+        Identity-map aware primary-key lookup with `role` loaded.
+
+        `db.get` returns an employee already in the session without emitting
+        SQL, but then ignores loader options; if that instance was loaded
+        without its role (e.g. via another entity's relationship), the role is
+        attached from a Role PK lookup so serialization never lazy-loads.
+        """
+        employee = await db.get(Employee, emp_id, options=[selectinload(Employee.role)])
+        if employee is not None and "role" in inspect(employee).unloaded:
+            set_committed_value(employee, "role", await db.get(Role, employee.role_id))
+        return employee
+
     @log_execution_time()
     async def get_by_id(self, db: AsyncSession, emp_id: int) -> Optional[Employee]:
         """Get employee by ID with comprehensive logging."""
@@ -41,12 +59,7 @@ class EmployeeRepository(BaseRepository[Employee]):
         self.logger.debug(f"{context}REPO_GET_BY_ID: Getting employee - ID: {emp_id}")
 
         try:
-            result = await db.execute(
-                select(Employee)
-                .options(selectinload(Employee.role))
-                .where(Employee.emp_id == emp_id)
-            )
-            employee = result.scalars().first()
+            employee = await self._get_with_role(db, emp_id)
 
             if employee:
                 self.logger.debug(f"{context}REPO_GET_BY_ID_SUCCESS: Found employee - ID: {emp_id}, Name: {sanitize_log_data(employee.emp_name)}")
@@ -73,8 +86,9 @@ class EmployeeRepository(BaseRepository[Employee]):
                 select(Employee)
                 .options(selectinload(Employee.role))
                 .where(Employee.emp_email == email)
+                .limit(1)
             )
-            employee = result.scalars().first()
+            employee = result.scalar_one_or_none()
 
             if employee:
                 self.logger.debug(f"{context}REPO_GET_BY_EMAIL_SUCCESS: Found employee - Email: {sanitized_email}, ID: {employee.emp_id}")
@@ -88,6 +102,61 @@ class EmployeeRepository(BaseRepository[Employee]):
             self.logger.error(f"{context}REPO_GET_BY_EMAIL_ERROR: {error_msg} - Email: {sanitized_email}, Error: {str(e)}")
             raise RepositoryException(error_msg, details={"email": email, "original_error": str(e)})
 
+    @log_execution_time()
+    async def get_credentials_by_email(self, db: AsyncSession, email: str) -> Optional[Row]:
+        """
+        Fetch only the columns password login needs, as a plain row.
+
+        Returns (emp_id, emp_email, emp_status, emp_password) or None. Skipping
+        ORM hydration, the role load and the identity map keeps the login query
+        as cheap as possible; the row is never attached to the session.
+        """
+        context = build_log_context()
+        sanitized_email = sanitize_log_data(email)
+
+        self.logger.debug(f"{context}REPO_GET_CREDENTIALS: Getting login credentials - Email: {sanitized_email}")
+
+        try:
+            result = await db.execute(
+                select(
+                    Employee.emp_id,
+                    Employee.emp_email,
+                    Employee.emp_status,
+                    Employee.emp_password
+                )
+                .where(Employee.emp_email == email)
+                .limit(1)
+            )
+            return result.one_or_none()
+
+        except Exception as e:
+            error_msg = f"Error retrieving login credentials"
+            self.logger.error(f"{context}REPO_GET_CREDENTIALS_ERROR: {error_msg} - Email: {sanitized_email}, Error: {str(e)}")
+            raise RepositoryException(error_msg, details={"email": email, "original_error": str(e)})
+
+    @log_execution_time()
+    async def get_status_by_id(self, db: AsyncSession, emp_id: int) -> Optional[Row]:
+        """
+        Fetch only (emp_id, emp_status) for an employee, as a plain row.
+
+        Used by the authentication check of endpoints that need just the
+        caller's ID: no ORM hydration, role load or identity-map entry.
+        """
+        context = build_log_context()
+
+        self.logger.debug(f"{context}REPO_GET_STATUS: Getting employee status - ID: {emp_id}")
+
+        try:
+            result = await db.execute(
+                select(Employee.emp_id, Employee.emp_status).where(Employee.emp_id == emp_id)
+            )
+            return result.one_or_none()
+
+        except Exception as e:
+            error_msg = f"Error retrieving employee status"
+            self.logger.error(f"{context}REPO_GET_STATUS_ERROR: {error_msg} - ID: {emp_id}, Error: {str(e)}")
+            raise RepositoryException(error_msg, details={"emp_id": emp_id, "original_error": str(e)})
+
     @log_execution_time()
     async def get_multi(
         self,
@@ -123,6 +192,47 @@ class EmployeeRepository(BaseRepository[Employee]):
             self.logger.error(f"{context}REPO_GET_MULTI_ERROR: {error_msg} - Skip: {skip}, Limit: {limit}, Error: {str(e)}")
             raise RepositoryException(error_msg, details={"skip": skip, "limit": limit, "original_error": str(e)})
 
+    async def stream_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[List] = None,
+        order_by=None,
+        options: Optional[List] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[Employee]:
+        """
+        Stream employees (with role) from a server-side cursor.
+
+        Same signature as `BaseRepository.stream_multi`, so `BaseService.stream_multi`
+        can call it; extra `options` are applied on top of the role load. Rows
+        are fetched `batch_size` at a time; `selectinload` runs once per batch,
+        so memory is bounded by the batch rather than the full page.
+        """
+        context = build_log_context()
+        
+        filter_count = len(filters) if filters else 0
+        self.logger.debug(f"{context}REPO_STREAM_MULTI: Streaming employees - Skip: {skip}, Limit: {limit}, Filters: {filter_count}")
+        
+        query = select(Employee).options(selectinload(Employee.role), *(options or ()))
+        if filters:
+            query = query.where(and_(*filters))
+        if order_by is not None:
+            query = query.order_by(order_by)
+        query = query.offset(skip).limit(limit).execution_options(yield_per=batch_size)
+        
+        try:
+            result = await db.stream_scalars(query)
+        except Exception as e:
+            error_msg = f"Error streaming multiple employees"
+            self.logger.error(f"{context}REPO_STREAM_MULTI_ERROR: {error_msg} - Skip: {skip}, Limit: {limit}, Error: {str(e)}")
+            raise RepositoryException(error_msg, details={"skip": skip, "limit": limit, "original_error": str(e)})
+        
+        async for employee in result:
+            yield employee
+
     @log_execution_time()
     async def create(self, db: AsyncSession, employee: Employee) -> Employee:
         """Create a new employee with comprehensive logging."""
@@ -133,10 +243,10 @@ class EmployeeRepository(BaseRepository[Employee]):
 
         try:
             db.add(employee)
+            # The INSERT returns emp_id (RETURNING) and every other column is either
+            # set by the caller or a Python-side default, so the flushed instance is
+            # already complete; no follow-up SELECT/refresh is needed
             await db.flush()
-            # Refresh entire instance so that SQLAlchemy loads column-based attributes
-            # (refreshing only relationship attributes can raise InvalidRequestError)
-            await db.refresh(employee)
 
             self.logger.info(f"{context}REPO_CREATE_SUCCESS: Employee created - ID: {employee.emp_id}, Name: {employee.emp_name}, Email: {sanitized_email}")
             return employee
@@ -147,6 +257,43 @@ class EmployeeRepository(BaseRepository[Employee]):
             self.logger.error(f"{context}REPO_CREATE_ERROR: {error_msg} - Name: {employee.emp_name}, Email: {sanitized_email}, Error: {str(e)}")
             raise RepositoryException(error_msg, details={"employee_name": employee.emp_name, "original_error": str(e)})
 
+    @log_execution_time()
+    async def create_if_email_available(self, db: AsyncSession, values: Dict[str, Any]) -> Optional[Employee]:
+        """
+        Insert an employee unless the email is taken, in a single round-trip.
+
+        Uses INSERT ... ON CONFLICT (emp_email) DO NOTHING RETURNING, mapped back
+        to an Employee in the session. Returns None when the email already
+        exists; unlike a SELECT-then-INSERT check this cannot race a concurrent
+        insert of the same email.
+        """
+        context = build_log_context()
+
+        sanitized_email = sanitize_log_data(values.get("emp_email"))
+        self.logger.debug(f"{context}REPO_CREATE: Creating employee - Name: {values.get('emp_name')}, Email: {sanitized_email}")
+
+        try:
+            stmt = (
+                pg_insert(Employee)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=[Employee.emp_email])
+                .returning(*Employee.__table__.columns)
+            )
+            result = await db.execute(select(Employee).from_statement(stmt))
+            employee = result.scalars().first()
+
+            if employee is None:
+                self.logger.debug(f"{context}REPO_CREATE_CONFLICT: Email already exists - Email: {sanitized_email}")
+            else:
+                self.logger.info(f"{context}REPO_CREATE_SUCCESS: Employee created - ID: {employee.emp_id}, Name: {employee.emp_name}, Email: {sanitized_email}")
+            return employee
+
+        except Exception as e:
+            # Don't rollback here - let the session dependency handle it
+            error_msg = f"Error creating employee"
+            self.logger.error(f"{context}REPO_CREATE_ERROR: {error_msg} - Name: {values.get('emp_name')}, Email: {sanitized_email}, Error: {str(e)}")
+            raise RepositoryException(error_msg, details={"employee_name": values.get("emp_name"), "original_error": str(e)})
+
     @log_execution_time()
     async def update(self, db: AsyncSession, employee: Employee) -> Employee:
         """Update an existing employee with comprehensive logging."""
@@ -208,7 +355,11 @@ class EmployeeRepository(BaseRepository[Employee]):
             if load_relationships:
                 for rel in load_relationships:
                     if rel == "subordinates":
-                        query = query.options(selectinload(Employee.subordinates))
+                        # Chain role so serializing each subordinate needs no lazy IO;
+                        # selectin keeps this at one IN-list query per level (no N+1)
+                        query = query.options(
+                            selectinload(Employee.subordinates).selectinload(Employee.role)
+                        )
                     if rel == "role":
                         query = query.options(selectinload(Employee.role))
                     # Add other relationships as needed
@@ -242,13 +393,14 @@ class EmployeeRepository(BaseRepository[Employee]):
         self.logger.debug(f"{context}REPO_CHECK_EMAIL_EXISTS: Checking email existence - Email: {sanitized_email}, Exclude ID: {exclude_id}")
         
         try:
-            query = select(Employee).where(Employee.emp_email == email)
+            # Only existence matters: fetch a single id rather than a full row
+            query = select(Employee.emp_id).where(Employee.emp_email == email)
             
             if exclude_id:
                 query = query.where(Employee.emp_id != exclude_id)
             
-            result = await db.execute(query)
-            exists = result.scalars().first() is not None
+            result = await db.execute(query.limit(1))
+            exists = result.scalar_one_or_none() is not None
             
             self.logger.debug(f"{context}REPO_CHECK_EMAIL_EXISTS_SUCCESS: Email check completed - Email: {sanitized_email}, Exists: {exists}")
             return exists
@@ -266,17 +418,9 @@ class EmployeeRepository(BaseRepository[Employee]):
         self.logger.debug(f"{context}REPO_VALIDATE_MANAGER: Validating manager existence - Manager ID: {manager_id}")
 
         try:
-            result = await db.execute(
-                select(Employee)
-                .options(selectinload(Employee.role))
-                .where(
-                    and_(
-                        Employee.emp_id == manager_id,
-                        Employee.emp_status == True
-                    )
-                )
-            )
-            manager = result.scalars().first()
+            manager = await self._get_with_role(db, manager_id)
+            if manager is not None and not manager.emp_status:
+                manager = None
 
             if manager:
                 self.logger.debug(f"{context}REPO_VALIDATE_MANAGER_SUCCESS: Valid manager found - ID: {manager_id}, Name: {manager.emp_name}")
@@ -13,6 +13,7 @@ from app.models.goal import goal_categories, Category
 from sqlalchemy.future import select
 from sqlalchemy import delete, insert
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from app.repositories.base_repository import BaseRepository
 from app.exceptions.domain_exceptions import RepositoryException
 from app.utils.logger import get_logger, build_log_context, log_execution_time
@@ -46,12 +47,15 @@ class GoalRepository(BaseRepository[Goal]):
             db.add(db_goal)
             await db.flush()
 
+            # Goal has no server-side defaults, so the flush (which fills in
+            # goal_id) leaves every column current; only the categories need
+            # loading, since the association rows bypass the ORM
             if category_ids:
                 for cid in category_ids:
                     await db.execute(insert(goal_categories).values(goal_id=db_goal.goal_id, category_id=cid))
                 await db.flush()
+            await self._set_loaded_categories(db, db_goal, category_ids)
 
-            await db.refresh(db_goal)
             self.logger.info(f"{context}REPO_CREATE_WITH_CATEGORIES_SUCCESS: Created goal - ID: {db_goal.goal_id}")
             return db_goal
 
@@ -60,6 +64,14 @@ class GoalRepository(BaseRepository[Goal]):
             self.logger.error(f"{context}REPO_CREATE_WITH_CATEGORIES_ERROR: Failed to create goal - Error: {str(e)}")
             raise RepositoryException("Error creating goal with categories", details={"title": title, "original_error": str(e)})
 
+    async def _set_loaded_categories(self, db: AsyncSession, goal: Goal, category_ids: Optional[List[int]]) -> None:
+        """Load the given categories onto `goal.categories` after a raw association write."""
+        categories = []
+        if category_ids:
+            result = await db.execute(select(Category).where(Category.id.in_(category_ids)))
+            categories = list(result.scalars().all())
+        set_committed_value(goal, "categories", categories)
+
     @log_execution_time()
     async def update_categories(self, db: AsyncSession, goal: Goal, category_ids: Optional[List[int]] = None) -> None:
         """Replace category associations for a goal."""
@@ -78,6 +90,7 @@ class GoalRepository(BaseRepository[Goal]):
                     await db.execute(insert(goal_categories).values(goal_id=gid, category_id=cid))
 
             await db.flush()
+            await self._set_loaded_categories(db, goal, category_ids)
             self.logger.info(f"{context}REPO_UPDATE_GOAL_CATEGORIES_SUCCESS: Updated categories for goal {gid}")
 
         except Exception as e:
@@ -13,6 +13,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import selectinload
 
 from app.models.goal import GoalTemplateHeader, GoalTemplate, GoalTemplateType
+from app.schemas.goal import GoalTemplateHeaderFilter
 from app.repositories.base_repository import BaseRepository
 from app.exceptions.domain_exceptions import RepositoryException
 from app.utils.logger import get_logger, build_log_context, log_execution_time
@@ -101,17 +102,20 @@ class GoalTemplateHeaderRepository(BaseRepository[GoalTemplateHeader]):
             raise RepositoryException(error_msg, details={"header_id": header_id, "original_error": str(e)})
 
     @log_execution_time()
-    async def get_all_with_templates(
+    async def list_headers(
         self,
         db: AsyncSession,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
+        filters: GoalTemplateHeaderFilter
     ) -> List[GoalTemplateHeader]:
-        """Get all headers with their templates."""
+        """
+        Get headers matching every set field of `filters`, with templates loaded.
+
+        All filters combine into one SELECT (plus the selectin loads for
+        templates and their categories), whatever the combination.
+        """
         context = build_log_context()
 
-        self.logger.debug(f"{context}REPO_GET_ALL_WITH_TEMPLATES: Getting all headers - Skip: {skip}, Limit: {limit}")
+        self.logger.debug(f"{context}REPO_LIST_HEADERS: Listing headers - Filters: {filters}")
 
         try:
             query = select(GoalTemplateHeader).options(
@@ -119,9 +123,28 @@ class GoalTemplateHeaderRepository(BaseRepository[GoalTemplateHeader]):
                 .selectinload(GoalTemplate.categories)
             )
 
-            # Apply search filter if provided
-            if search:
-                like_term = f"%{search}%"
+            if filters.application_role_id is not None:
+                query = query.where(GoalTemplateHeader.application_role_id == filters.application_role_id)
+
+            if filters.filter_type == "organization":
+                query = query.where(GoalTemplateHeader.goal_template_type == GoalTemplateType.ORGANIZATION)
+            elif filters.filter_type == "self":
+                # Self headers the user created, across all roles
+                query = query.where(
+                    GoalTemplateHeader.creator_id == filters.user_emp_id,
+                    GoalTemplateHeader.goal_template_type == GoalTemplateType.SELF
+                )
+            elif filters.filter_type == "shared":
+                # shared_users_id JSON array contains the user (JSONB @>); templates
+                # of any role can be shared with any user, so no role filter here
+                query = query.where(
+                    func.cast(GoalTemplateHeader.shared_users_id, JSONB).op('@>')(
+                        cast([filters.user_emp_id], JSONB)
+                    )
+                )
+
+            if filters.search:
+                like_term = f"%{filters.search}%"
                 query = query.where(
                     or_(
                         GoalTemplateHeader.title.ilike(like_term),
@@ -129,17 +152,17 @@ class GoalTemplateHeaderRepository(BaseRepository[GoalTemplateHeader]):
                     )
                 )
 
-            query = query.offset(skip).limit(limit)
+            query = query.offset(filters.skip).limit(filters.limit)
             result = await db.execute(query)
             headers = list(result.scalars().all())
 
-            self.logger.debug(f"{context}REPO_GET_ALL_WITH_TEMPLATES_SUCCESS: Retrieved {len(headers)} headers")
+            self.logger.debug(f"{context}REPO_LIST_HEADERS_SUCCESS: Retrieved {len(headers)} headers")
             return headers
 
         except Exception as e:
-            error_msg = "Error getting all headers with templates"
-            self.logger.error(f"{context}REPO_GET_ALL_WITH_TEMPLATES_ERROR: {error_msg}, Error: {str(e)}")
-            raise RepositoryException(error_msg, details={"skip": skip, "limit": limit, "original_error": str(e)})
+            error_msg = "Error listing headers"
+            self.logger.error(f"{context}REPO_LIST_HEADERS_ERROR: {error_msg}, Error: {str(e)}")
+            raise RepositoryException(error_msg, details={"filters": filters.model_dump(), "original_error": str(e)})
 
     @log_execution_time()
     async def check_duplicate_title(
@@ -174,209 +197,6 @@ class GoalTemplateHeaderRepository(BaseRepository[GoalTemplateHeader]):
             self.logger.error(f"{context}REPO_CHECK_DUPLICATE_TITLE_ERROR: {error_msg}, Error: {str(e)}")
             raise RepositoryException(error_msg, details={"role_id": role_id, "title": title, "original_error": str(e)})
 
-    @log_execution_time()
-    async def get_by_type(
-        self,
-        db: AsyncSession,
-        goal_template_type: GoalTemplateType,
-        load_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all headers of a specific type (Organization or Self)."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}REPO_GET_BY_TYPE: Getting headers by type - Type: {goal_template_type}, Load Templates: {load_templates}")
-
-        try:
-            query = select(GoalTemplateHeader).where(GoalTemplateHeader.goal_template_type == goal_template_type)
-
-            if search:
-                like_term = f"%{search}%"
-                query = query.where(
-                    or_(
-                        GoalTemplateHeader.title.ilike(like_term),
-                        GoalTemplateHeader.description.ilike(like_term)
-                    )
-                )
-
-            if load_templates:
-                query = query.options(
-                    selectinload(GoalTemplateHeader.goal_templates)
-                    .selectinload(GoalTemplate.categories)
-                )
-
-            query = query.offset(skip).limit(limit)
-            result = await db.execute(query)
-            headers = list(result.scalars().all())
-
-            self.logger.debug(f"{context}REPO_GET_BY_TYPE_SUCCESS: Retrieved {len(headers)} headers of type {goal_template_type}")
-            return headers
-
-        except Exception as e:
-            error_msg = f"Error getting headers by type {goal_template_type}"
-            self.logger.error(f"{context}REPO_GET_BY_TYPE_ERROR: {error_msg}, Error: {str(e)}")
-            raise RepositoryException(error_msg, details={"goal_template_type": str(goal_template_type), "original_error": str(e)})
-
-    @log_execution_time()
-    async def get_by_creator(
-        self,
-        db: AsyncSession,
-        creator_id: int,
-        role_id: Optional[int],
-        load_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all headers created by a specific user with type Self. If role_id is None, returns all roles."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}REPO_GET_BY_CREATOR: Getting headers by creator - Creator ID: {creator_id}, Role ID: {role_id}, Load Templates: {load_templates}")
-
-        try:
-            # Get all Self headers created by this user
-            query = select(GoalTemplateHeader).where(
-                GoalTemplateHeader.creator_id == creator_id,
-                GoalTemplateHeader.goal_template_type == GoalTemplateType.SELF
-            )
-            
-            # Optionally filter by role if role_id is provided
-            if role_id is not None:
-                query = query.where(GoalTemplateHeader.role_id == role_id)
-
-            if search:
-                like_term = f"%{search}%"
-                query = query.where(
-                    or_(
-                        GoalTemplateHeader.title.ilike(like_term),
-                        GoalTemplateHeader.description.ilike(like_term)
-                    )
-                )
-
-            if load_templates:
-                query = query.options(
-                    selectinload(GoalTemplateHeader.goal_templates)
-                    .selectinload(GoalTemplate.categories)
-                )
-
-            query = query.offset(skip).limit(limit)
-            result = await db.execute(query)
-            headers = list(result.scalars().all())
-
-            role_info = f"with role {role_id}" if role_id is not None else "for all roles"
-            self.logger.debug(f"{context}REPO_GET_BY_CREATOR_SUCCESS: Retrieved {len(headers)} headers for creator {creator_id} {role_info}")
-            return headers
-
-        except Exception as e:
-            error_msg = f"Error getting headers by creator {creator_id}"
-            self.logger.error(f"{context}REPO_GET_BY_CREATOR_ERROR: {error_msg}, Error: {str(e)}")
-            raise RepositoryException(error_msg, details={"creator_id": creator_id, "role_id": role_id, "original_error": str(e)})
-
-    @log_execution_time()
-    async def get_shared_with_user(
-        self,
-        db: AsyncSession,
-        user_id: int,
-        role_id: int,
-        load_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all headers shared with a specific user. Note: role_id parameter kept for compatibility but not used."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}REPO_GET_SHARED_WITH_USER: Getting headers shared with user - User ID: {user_id}, Load Templates: {load_templates}")
-
-        try:
-            # Query headers where:
-            # - shared_users_id array contains the user_id (read-only shared headers)
-            # This returns headers that other users have shared with this user
-            # Use JSONB containment operator @> to check if user_id is in the JSON array
-            # NOTE: We do NOT filter by role_id because templates of any role can be shared with any user
-            query = select(GoalTemplateHeader).where(
-                func.cast(GoalTemplateHeader.shared_users_id, JSONB).op('@>')(
-                    cast([user_id], JSONB)
-                )
-            )
-
-            if search:
-                like_term = f"%{search}%"
-                query = query.where(
-                    or_(
-                        GoalTemplateHeader.title.ilike(like_term),
-                        GoalTemplateHeader.description.ilike(like_term)
-                    )
-                )
-
-            query = query.offset(skip).limit(limit)
-
-            if load_templates:
-                query = query.options(
-                    selectinload(GoalTemplateHeader.goal_templates)
-                    .selectinload(GoalTemplate.categories)
-                )
-
-            result = await db.execute(query)
-            headers = list(result.scalars().all())
-
-            self.logger.debug(f"{context}REPO_GET_SHARED_WITH_USER_SUCCESS: Retrieved {len(headers)} headers shared with user {user_id}")
-            return headers
-
-        except Exception as e:
-            error_msg = f"Error getting headers shared with user {user_id}"
-            self.logger.error(f"{context}REPO_GET_SHARED_WITH_USER_ERROR: {error_msg}, Error: {str(e)}")
-            raise RepositoryException(error_msg, details={"user_id": user_id, "original_error": str(e)})
-
-    @log_execution_time()
-    async def get_by_application_role(
-        self,
-        db: AsyncSession,
-        application_role_id: int,
-        load_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all headers for a specific application role."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}REPO_GET_BY_APP_ROLE: Getting headers - App Role ID: {application_role_id}")
-
-        try:
-            query = select(GoalTemplateHeader).where(
-                GoalTemplateHeader.application_role_id == application_role_id
-            )
-
-            if search:
-                like_term = f"%{search}%"
-                query = query.where(
-                    or_(
-                        GoalTemplateHeader.title.ilike(like_term),
-                        GoalTemplateHeader.description.ilike(like_term)
-                    )
-                )
-
-            if load_templates:
-                query = query.options(
-                    selectinload(GoalTemplateHeader.goal_templates)
-                    .selectinload(GoalTemplate.categories)
-                )
-
-            query = query.offset(skip).limit(limit)
-            result = await db.execute(query)
-            headers = list(result.scalars().all())
-
-            self.logger.debug(f"{context}REPO_GET_BY_APP_ROLE_SUCCESS: Retrieved {len(headers)} headers")
-            return headers
-
-        except Exception as e:
-            error_msg = f"Error getting headers by application_role_id {application_role_id}"
-            self.logger.error(f"{context}REPO_GET_BY_APP_ROLE_ERROR: {error_msg}, Error: {str(e)}")
-            raise RepositoryException(error_msg, details={"application_role_id": application_role_id, "original_error": str(e)})
-
     @log_execution_time()
     async def check_duplicate_title(
         self,
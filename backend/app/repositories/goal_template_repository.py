@@ -11,7 +11,7 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy import delete, insert
 
-from app.models.goal import GoalTemplate, Category, goal_template_categories
+from app.models.goal import GoalTemplate, GoalTemplateHeader, Category, goal_template_categories
 from app.repositories.base_repository import BaseRepository
 from app.exceptions.domain_exceptions import RepositoryException
 from app.utils.logger import get_logger, build_log_context, log_execution_time
@@ -117,9 +117,10 @@ class GoalTemplateRepository(BaseRepository[GoalTemplate]):
                 categories=categories
             )
             
+            # No server-side defaults and the categories are assigned above, so
+            # the flush (which fills in temp_id) leaves the template complete
             db.add(db_template)
             await db.flush()
-            await db.refresh(db_template)
             
             self.logger.info(f"{context}REPO_CREATE_WITH_CATEGORIES_SUCCESS: Created goal template with categories - ID: {db_template.temp_id}, Title: {template_title}")
             return db_template
@@ -192,7 +193,6 @@ class GoalTemplateRepository(BaseRepository[GoalTemplate]):
                 category = Category(name=category_name)
                 db.add(category)
                 await db.flush()
-                await db.refresh(category)
 
                 self.logger.info(f"{context}REPO_GET_OR_CREATE_CATEGORY_CREATED: Created new category - ID: {category.id}, Name: {category_name}")
             else:
@@ -246,8 +246,6 @@ class GoalTemplateRepository(BaseRepository[GoalTemplate]):
         self.logger.debug(f"{context}REPO_GET_BY_ROLE_ID: Getting templates for role - Role ID: {role_id}")
 
         try:
-            from app.models.goal import GoalTemplateHeader
-
             query = (
                 select(GoalTemplate)
                 .join(GoalTemplateHeader, GoalTemplate.header_id == GoalTemplateHeader.header_id)
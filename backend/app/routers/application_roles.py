@@ -21,16 +21,13 @@ from app.exceptions.domain_exceptions import (
     map_domain_exception_to_http_status
 )
 from app.services.application_role_service import ApplicationRoleService
+from app.dependencies.services import get_app_role_service
+from app.utils.catalog_cache import invalidate_catalog_caches
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 logger = get_logger(__name__)
 
 
-def get_app_role_service() -> ApplicationRoleService:
-    """Dependency to get application role service instance."""
-    return ApplicationRoleService()
-
-
 @router.post("/", response_model=ApplicationRoleResponse, status_code=status.HTTP_201_CREATED)
 @log_execution_time()
 async def create_application_role(
@@ -215,6 +212,10 @@ async def delete_application_role(
             logger.error(f"{context}ROUTER_DELETE_APP_ROLE_FAILED: Failed to delete role {app_role_id}")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete role")
 
+        # The role's headers and their templates go with it (ON DELETE CASCADE)
+        await db.commit()
+        invalidate_catalog_caches()
+
         logger.info(f"{context}ROUTER_DELETE_APP_ROLE_SUCCESS: Deleted role {app_role_id}")
 
     except BaseDomainException as e:
@@ -9,7 +9,7 @@ from app.db.database import get_db
 from app.models.appraisal import Appraisal, AppraisalStatus
 from app.models.goal import Goal, AppraisalGoal, Category
 from app.schemas.appraisal import AppraisalWithGoals
-from app.services.appraisal_service import AppraisalService
+from app.dependencies.services import get_appraisal_service
 from app.utils.logger import get_logger, build_log_context, sanitize_log_data
 from app.exceptions.domain_exceptions import (
     BaseDomainException, map_domain_exception_to_http_status
@@ -25,11 +25,6 @@ from app.constants import (
 router = APIRouter(dependencies=[Depends(get_current_user)])
 logger = get_logger(__name__)
 
-def get_appraisal_service() -> AppraisalService:
-    """Dependency to get appraisal service instance."""
-    return AppraisalService()
-
-
 @router.post("/{appraisal_id}/goals/{goal_id}", response_model=AppraisalWithGoals)
 async def add_goal_to_appraisal(
     appraisal_id: int,
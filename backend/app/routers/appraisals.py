@@ -30,6 +30,7 @@ from app.schemas.appraisal import (
     ReviewerEvaluationUpdate
 )
 from app.services.appraisal_service import AppraisalService
+from app.dependencies.services import get_appraisal_service
 from app.routers.auth import get_current_user, get_current_active_user
 from app.dependencies import (
     get_pagination_params,
@@ -49,11 +50,6 @@ class AddGoalsRequest(BaseModel):
     goal_ids: List[int]
 
 
-def get_appraisal_service() -> AppraisalService:
-    """Dependency to get appraisal service instance."""
-    return AppraisalService()
-
-
 @router.post("/", response_model=AppraisalResponse, status_code=status.HTTP_201_CREATED)
 async def create_appraisal(
     appraisal_data: AppraisalCreate,
@@ -2,7 +2,10 @@
 Authentication routes for the Performance Management System.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,14 +14,13 @@ from app.services.auth_service import AuthService
 from app.dependencies.auth import get_auth_service, get_current_active_user
 from app.schemas.auth import TokenResponse, RefreshTokenRequest, UserInfo, PasswordResetRequest, PasswordResetConfirm
 from app.exceptions import UnauthorizedError, EntityNotFoundError
-from app.exceptions.domain_exceptions import BaseDomainException, map_domain_exception_to_http_status
 from app.models.employee import Employee
 from app.utils.logger import get_logger, build_log_context, sanitize_log_data
 from app.utils.email import send_email_background
 from app.core.config import settings
 from app.utils.rate_limiter import RateLimiter
 
-router = APIRouter(prefix="/api/auth", tags=["authentication"])
+router = APIRouter(prefix="/api/auth", tags=["authentication"], default_response_class=ORJSONResponse)
 
 # Simple in-process rate limiters. These are defensive; for multi-instance
 # deployments use a shared store (Redis) or a gateway rate limiter.
@@ -29,6 +31,29 @@ email_limiter = RateLimiter(limit=3, window_seconds=24 * 3600)
 # Initialize logger
 logger = get_logger(__name__)
 
+# Settings are fixed for the process lifetime, so resolve the reset-link base once
+_FRONTEND_BASE = (settings.FRONTEND_URL or "").rstrip('/')
+_RESET_URL_FMT = _FRONTEND_BASE + "/reset-password?token={}" if _FRONTEND_BASE else None
+
+# Fixed response payloads. Exceptions are still instantiated per raise: re-raising
+# one shared instance would keep growing its __traceback__ (and pinning frames).
+_TOO_MANY_REQUESTS_DETAIL = {"message": "Too many requests"}
+_FORGOT_PASSWORD_RESPONSE = {"message": "If an account with that email exists, a password reset link has been sent."}
+
+
+def _client_ip(request: Request) -> str:
+    """Best-effort client IP used as the rate-limiter key.
+
+    Behind a reverse proxy `request.client.host` is the proxy address, so every
+    caller would share one limiter bucket. When TRUST_PROXY is enabled the
+    leftmost `X-Forwarded-For` entry (the original client) is used instead.
+    """
+    if getattr(settings, "TRUST_PROXY", False):
+        forwarded_ip = request.headers.get("x-forwarded-for", "").split(",")[0].strip()
+        if forwarded_ip:
+            return forwarded_ip
+    return request.client.host if request.client else "unknown"
+
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
@@ -48,47 +73,17 @@ async def login(
         TokenResponse: Access and refresh tokens
         
     Raises:
-        HTTPException: Converted from domain exceptions
+        BaseDomainException: Mapped to an HTTP response by the global handlers
     """
     context = build_log_context()
-    sanitized_email = sanitize_log_data(form_data.username)
     
-    logger.info(f"{context}API_REQUEST: POST /login - Login attempt - Email: {sanitized_email}")
-    
-    try:
-        tokens = await auth_service.login(
-            db, 
-            email=form_data.username, 
-            password=form_data.password
-        )
-        
-        logger.info(f"{context}API_SUCCESS: Login successful - Email: {sanitized_email}")
-        return TokenResponse(**tokens)
-        
-    except BaseDomainException as e:
-        # Convert domain exceptions to HTTP exceptions
-        status_code = map_domain_exception_to_http_status(e)
-        logger.warning(f"{context}DOMAIN_EXCEPTION: {e.__class__.__name__} - Login failed - Email: {sanitized_email}")
-        raise HTTPException(
-            status_code=status_code,
-            detail={
-                "error": e.__class__.__name__,
-                "message": str(e),
-                "details": getattr(e, 'details', {})
-            },
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-        
-    except Exception as e:
-        # Handle unexpected errors
-        logger.error(f"{context}UNEXPECTED_ERROR: Login failed - Email: {sanitized_email}, Error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred during login"
-            }
-        )
+    logger.info("%sAPI_REQUEST: POST /login - Login attempt - Email: %s", context, form_data.username, extra={"sanitize": True})
+
+    # Domain and unexpected errors are mapped by the global exception handlers
+    tokens = await auth_service.login(db, email=form_data.username, password=form_data.password)
+
+    logger.info("%sAPI_SUCCESS: Login successful - Email: %s", context, form_data.username, extra={"sanitize": True})
+    return TokenResponse(**tokens)
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -109,44 +104,16 @@ async def refresh_token(
         TokenResponse: New access and refresh tokens
         
     Raises:
-        HTTPException: Converted from domain exceptions
+        BaseDomainException: Mapped to an HTTP response by the global handlers
     """
     context = build_log_context()
     
-    logger.info(f"{context}API_REQUEST: POST /refresh - Token refresh attempt")
-    
-    try:
-        tokens = await auth_service.refresh_access_token(
-            db, 
-            refresh_token=refresh_data.refresh_token
-        )
-        
-        logger.info(f"{context}API_SUCCESS: Token refresh successful")
-        return TokenResponse(**tokens)
-        
-    except BaseDomainException as e:
-        # Convert domain exceptions to HTTP exceptions
-        status_code = map_domain_exception_to_http_status(e)
-        logger.warning(f"{context}DOMAIN_EXCEPTION: {e.__class__.__name__} - Token refresh failed")
-        raise HTTPException(
-            status_code=status_code,
-            detail={
-                "error": e.__class__.__name__,
-                "message": str(e),
-                "details": getattr(e, 'details', {})
-            }
-        )
-        
-    except Exception as e:
-        # Handle unexpected errors
-        logger.error(f"{context}UNEXPECTED_ERROR: Token refresh failed - Error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred during token refresh"
-            }
-        )
+    logger.info("%sAPI_REQUEST: POST /refresh - Token refresh attempt", context)
+
+    tokens = await auth_service.refresh_access_token(db, refresh_token=refresh_data.refresh_token)
+
+    logger.info("%sAPI_SUCCESS: Token refresh successful", context)
+    return TokenResponse(**tokens)
 
 
 @router.get("/me", response_model=UserInfo)
@@ -163,29 +130,17 @@ async def get_current_user_info(
         UserInfo: Current user information
         
     Raises:
-        HTTPException: Converted from domain exceptions
+        BaseDomainException: Mapped to an HTTP response by the global handlers
     """
     user_id = current_user.emp_id
     context = build_log_context(user_id=str(user_id))
     
-    logger.info(f"{context}API_REQUEST: GET /me - Get current user info")
-    
-    try:
-        user_info = UserInfo.model_validate(current_user)
-        
-        logger.info(f"{context}API_SUCCESS: Retrieved current user info - User ID: {user_id}")
-        return user_info
-        
-    except Exception as e:
-        # Handle unexpected errors
-        logger.error(f"{context}UNEXPECTED_ERROR: Failed to get current user info - Error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while retrieving user information"
-            }
-        )
+    logger.info("%sAPI_REQUEST: GET /me - Get current user info", context)
+
+    user_info = UserInfo.model_validate(current_user)
+
+    logger.info("%sAPI_SUCCESS: Retrieved current user info - User ID: %s", context, user_id)
+    return user_info
 
 
 @router.post("/password/forgot")
@@ -202,68 +157,67 @@ async def password_forgot(
     context = build_log_context()
     sanitized_email = sanitize_log_data(data.email)
 
-    logger.info(f"{context}API_REQUEST: POST /password/forgot - Password reset requested - Email: {sanitized_email}")
+    logger.info("%sAPI_REQUEST: POST /password/forgot - Password reset requested - Email: %s", context, sanitized_email)
 
-    # Determine client IP (best-effort). If behind a proxy, consider X-Forwarded-For parsing.
-    client_ip = None
-    try:
-        client_ip = request.client.host if request.client else "unknown"
-    except Exception:
-        client_ip = "unknown"
+    # Determine client IP (best-effort, honours X-Forwarded-For when TRUST_PROXY is set)
+    client_ip = _client_ip(request)
 
     # Enforce per-IP rate limit
     if not await ip_limiter.allow(client_ip):
-        logger.warning(f"{context}RATE_LIMIT: IP rate limit exceeded - ip={client_ip}")
-        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail={"message": "Too many requests"})
+        logger.warning("%sRATE_LIMIT: IP rate limit exceeded - ip=%s", context, client_ip)
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=_TOO_MANY_REQUESTS_DETAIL)
 
     # Enforce per-email rate limit (best-effort even if email doesn't exist)
     if not await email_limiter.allow(data.email.lower()):
-        logger.warning(f"{context}RATE_LIMIT: Email rate limit exceeded - email={sanitized_email}")
-        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail={"message": "Too many requests"})
+        logger.warning("%sRATE_LIMIT: Email rate limit exceeded - email=%s", context, sanitized_email)
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=_TOO_MANY_REQUESTS_DETAIL)
 
     try:
-        employee = await auth_service.employee_service.get_employee_by_email(db, email=data.email)
+        employee = await auth_service.get_employee_by_email(db, email=data.email)
 
         # Always return success message to avoid leaking user existence
-        generic_message = {"message": "If an account with that email exists, a password reset link has been sent."}
+        generic_message = _FORGOT_PASSWORD_RESPONSE
         if not employee:
-            logger.info(f"{context}API_INFO: Password reset requested for non-existent email - {sanitized_email}")
+            logger.info("%sAPI_INFO: Password reset requested for non-existent email - %s", context, sanitized_email)
             return generic_message
 
         # Create token and persist jti (one-time use) then send email
         token = await auth_service.create_password_reset_token(db, employee=employee)
 
         # Build reset URL; fallback to request base URL if FRONTEND_URL not configured
-        frontend_base = (settings.FRONTEND_URL or "").rstrip('/')
-        if not frontend_base:
+        if _RESET_URL_FMT:
+            reset_url = _RESET_URL_FMT.format(token)
+        else:
             # request.base_url is a URL object; convert to string and strip trailing slash
             frontend_base = str(request.base_url).rstrip('/')
-
-        reset_url = f"{frontend_base}/reset-password?token={token}"
+            reset_url = f"{frontend_base}/reset-password?token={token}"
 
         email_context = {
             "appraisee_name": employee.emp_name,
             "reset_url": reset_url
         }
 
-        # fire-and-forget background send
-        await send_email_background(
+        # fire-and-forget background send; the app-level set keeps the task alive until done
+        task = asyncio.create_task(send_email_background(
             subject="Password reset for Performance Management System",
             template_name="password_reset.html",
             context=email_context,
             to=employee.emp_email
-        )
+        ))
+        bg_tasks = request.app.state.bg_tasks
+        bg_tasks.add(task)
+        task.add_done_callback(bg_tasks.discard)
 
-        logger.info(f"{context}API_SUCCESS: Password reset email scheduled - Employee ID: {employee.emp_id}")
+        logger.info("%sAPI_SUCCESS: Password reset email scheduled - Employee ID: %s", context, employee.emp_id)
         return generic_message
 
     except HTTPException:
         # Propagate rate-limit related HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"{context}UNEXPECTED_ERROR: Password forgot failed - Email: {sanitized_email}, Error: {str(e)}")
+        logger.error("%sUNEXPECTED_ERROR: Password forgot failed - Email: %s, Error: %s", context, sanitized_email, e)
         # Return generic message
-        return {"message": "If an account with that email exists, a password reset link has been sent."}
+        return _FORGOT_PASSWORD_RESPONSE
 
 
 @router.post("/password/reset")
@@ -275,19 +229,15 @@ async def password_reset(
     """Reset password using a token and a new password."""
     context = build_log_context()
 
-    logger.info(f"{context}API_REQUEST: POST /password/reset - Attempting password reset")
+    logger.info("%sAPI_REQUEST: POST /password/reset - Attempting password reset", context)
 
     try:
         # This will raise UnauthorizedError if token invalid/expired
         await auth_service.reset_password(db, token=data.token, new_password=data.new_password)
-
-        logger.info(f"{context}API_SUCCESS: Password reset completed")
-        return {"message": "Password has been reset successfully."}
-
     except UnauthorizedError as e:
-        logger.warning(f"{context}API_WARNING: Password reset failed - {str(e)}")
+        # An invalid/expired reset token is a bad request here, not a 401
+        logger.warning("%sAPI_WARNING: Password reset failed - %s", context, e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": "InvalidToken", "message": str(e)})
 
-    except Exception as e:
-        logger.error(f"{context}UNEXPECTED_ERROR: Password reset failed - Error: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error": "InternalServerError", "message": "Password reset failed"})
\ No newline at end of file
+    logger.info("%sAPI_SUCCESS: Password reset completed", context)
+    return {"message": "Password has been reset successfully."}
@@ -1,8 +1,18 @@
+import hashlib
+import os
+import time
 from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
-import mimetypes
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from app.core.config import settings
 
 # Import logging components
 from app.utils.logger import get_logger, build_log_context, sanitize_log_data
@@ -15,133 +25,397 @@ router = APIRouter()
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent  # goes up to project root
 FRONTEND_DIR = PROJECT_ROOT / "dist"
 
-# Initialize frontend serving with logging
-context = build_log_context()
-logger.info(f"{context}FRONTEND_INIT: Initializing frontend serving - Project root: {sanitize_log_data(str(PROJECT_ROOT))}")
-logger.info(f"{context}FRONTEND_INIT: Frontend directory: {sanitize_log_data(str(FRONTEND_DIR))}")
-
-# Mount static files
-# Mount static assets directory if present
-if FRONTEND_DIR.exists() and (FRONTEND_DIR / "assets").exists():
-    logger.info(f"{context}FRONTEND_SETUP: Mounting static assets directory - {FRONTEND_DIR / 'assets'}")
-    router.mount("/assets", StaticFiles(directory=str(FRONTEND_DIR / "assets")), name="assets")
-    logger.info(f"{context}FRONTEND_SETUP: Static assets mounted successfully")
+# Initialize frontend serving with logging. The context carries no request or
+# user data, so it is built once and shared by the per-request log calls below.
+_CTX = build_log_context()
+logger.info(f"{_CTX}FRONTEND_INIT: Initializing frontend serving - Project root: {sanitize_log_data(str(PROJECT_ROOT))}")
+logger.info(f"{_CTX}FRONTEND_INIT: Frontend directory: {sanitize_log_data(str(FRONTEND_DIR))}")
+
+# Built files (assets/*, favicon.ico, ...) are served by `spa_files`, which
+# main.py mounts at "/" after every API route
+if FRONTEND_DIR.exists():
+    logger.info(f"{_CTX}FRONTEND_SETUP: Frontend build found - {sanitize_log_data(str(FRONTEND_DIR))}")
 else:
-    logger.warning(f"{context}FRONTEND_SETUP: Frontend assets not found - {FRONTEND_DIR / 'assets'}")
-    logger.info(f"{context}FRONTEND_SETUP: Static asset mount skipped")
+    logger.warning(f"{_CTX}FRONTEND_SETUP: Frontend build not found - {sanitize_log_data(str(FRONTEND_DIR))}")
 
 
-# Always register SPA-serving routes. At request-time we will check for the
-# built `index.html` and serve it when available; if not available return a
-# clear 404. This avoids the previous logic bug where the handlers were only
-# defined when `dist` did NOT exist.
-@router.get("/", response_class=HTMLResponse)
-async def serve_root():
-    """Serve the main React application index.html file if present, otherwise 404."""
-    context = build_log_context()
+INDEX_FILE = FRONTEND_DIR / "index.html"
+INDEX_PATH = str(INDEX_FILE)
+
+# index.html is served for nearly every navigation, so by default keep its bytes
+# (and an ETag for revalidation) in memory instead of reading the file per
+# request. The file's mtime is re-checked at most every FRONTEND_INDEX_RECHECK_S
+# seconds, so a deploy that replaces dist/ in place is picked up without a restart.
+# Set FRONTEND_CACHE_INDEX=False to stream it from disk with FileResponse instead
+# (no per-worker copy, and the file is never decoded/re-encoded in Python).
+_CACHE_INDEX = getattr(settings, "FRONTEND_CACHE_INDEX", True)
+_INDEX_RECHECK_S = getattr(settings, "FRONTEND_INDEX_RECHECK_S", None) or 5
+# no-cache: browsers must revalidate, so a redeploy is picked up immediately
+_INDEX_CACHE_CONTROL = "no-cache"
+# (200 response, 304 response, etag), rebuilt only when the file changes.
+# Starlette never mutates a Response while sending it, so the same objects
+# are returned to every request
+_index_cache: Optional[Tuple[Response, Response, str]] = None
+_index_mtime_ns: Optional[int] = None
+_index_checked_at = 0.0
+
+
+def _load_index() -> Optional[Tuple[Response, Response, str]]:
+    """Return the prebuilt index.html responses, (re)reading the file when it changed."""
+    global _index_cache, _index_mtime_ns, _index_checked_at
+    now = time.monotonic()
+    if _index_cache is not None and now - _index_checked_at < _INDEX_RECHECK_S:
+        return _index_cache
+    _index_checked_at = now
 
     try:
-        logger.debug(f"{context}FRONTEND_REQUEST: Serving root path - /")
+        mtime_ns = os.stat(INDEX_PATH).st_mtime_ns
+    except OSError:
+        # Not built (or removed mid-deploy): keep serving the last good copy
+        return _index_cache
+    if _index_cache is not None and mtime_ns == _index_mtime_ns:
+        return _index_cache
 
-        index_file = FRONTEND_DIR / "index.html"
+    body = INDEX_FILE.read_bytes()
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": _INDEX_CACHE_CONTROL}
+    _index_cache = (
+        HTMLResponse(content=body, headers=headers),
+        Response(status_code=304, headers=headers),
+        etag,
+    )
+    _index_mtime_ns = mtime_ns
+    logger.info(f"{_CTX}FRONTEND_CACHE: Cached index.html - {len(body)} bytes")
+    return _index_cache
 
-        if index_file.exists():
-            logger.info(f"{context}FRONTEND_SUCCESS: Serving index.html from {sanitize_log_data(str(index_file))}")
-            content = index_file.read_text(encoding="utf-8")
-            logger.debug(f"{context}FRONTEND_CONTENT: Index file size - {len(content)} characters")
-            return HTMLResponse(content=content)
 
-        logger.warning(f"{context}FRONTEND_NOT_BUILT: Index file not present - {sanitize_log_data(str(index_file))}")
-        raise HTTPException(status_code=404, detail="FRONTEND_NOT_AVAILABLE")
+def _index_response(request: Request) -> Optional[Response]:
+    """Return the index.html response, or None when the frontend is not built.
+
+    The in-memory variant answers 304 when the client's copy is current.
+    """
+    if not _CACHE_INDEX:
+        if not INDEX_FILE.is_file():
+            return None
+        return FileResponse(INDEX_PATH, media_type="text/html", headers={"Cache-Control": _INDEX_CACHE_CONTROL})
+
+    index = _load_index()
+    if index is None:
+        return None
+    full, not_modified, etag = index
+    if request.headers.get("if-none-match") == etag:
+        return not_modified
+    return full
+
+
+if _CACHE_INDEX:
+    _load_index()
+
+# Reserved paths the SPA fallback must never answer: the roots themselves are an
+# O(1) set probe, their subtrees one str.startswith call over the prefix tuple
+_BLOCKED_EXACT = frozenset(("api", "docs", "redoc", "openapi.json"))
+_BLOCKED_PREFIXES = ("api/", "docs/", "redoc/")
+
+# Content types for the files a Vite build emits, resolved by one dict lookup
+# on the suffix rather than a guess_type() table walk per request. Unlisted
+# suffixes fall back to Starlette's own guess.
+_MEDIA_TYPES = {
+    ".js": "text/javascript",
+    ".mjs": "text/javascript",
+    ".css": "text/css",
+    ".html": "text/html",
+    ".svg": "image/svg+xml",
+    ".json": "application/json",
+    ".map": "application/json",
+    ".webmanifest": "application/manifest+json",
+    ".wasm": "application/wasm",
+    ".ico": "image/x-icon",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".txt": "text/plain",
+}
+
+# Vite emits content-hashed files under assets/: a given name never changes, so
+# browsers/CDNs may keep them for a year without revalidating. Other build files
+# (favicon.ico, robots.txt, ...) keep their names across deploys: cache briefly,
+# then revalidate.
+_ASSETS_DIR = os.path.join(str(FRONTEND_DIR), "assets", "")
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Behind nginx, FRONTEND_ACCEL_REDIRECT_PREFIX (e.g. "/internal-dist/", an
+# `internal;` location aliased to dist/) makes file responses an empty body
+# with X-Accel-Redirect, so nginx streams the bytes with sendfile(2) and no
+# file data passes through the worker. ASGI never exposes the client socket,
+# so this is the only way to reach sendfile when the server lacks zerocopysend.
+_ACCEL_REDIRECT_PREFIX = getattr(settings, "FRONTEND_ACCEL_REDIRECT_PREFIX", None)
+_DIST_ROOT = os.path.join(str(FRONTEND_DIR), "")
+_STATIC_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+
+# The frontend build (the precompress plugin in frontend/vite.config.ts) writes
+# .br/.gz siblings of the text-like build files, so responses never compress
+# per request. Binary formats (images, woff2, wasm) are already compressed.
+_COMPRESSIBLE_SUFFIXES = frozenset((".js", ".mjs", ".css", ".html", ".svg", ".json", ".map", ".txt", ".webmanifest"))
+# (Accept-Encoding token, sibling suffix), in order of preference
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+# dist/ only changes on deploy, so its files are listed once as
+# {normalized relative path: (full path, stat)} and request lookups are dict
+# probes with no syscalls. Paths outside the listing (including any traversal
+# attempt) simply miss. The dist/ and dist/assets/ mtimes are re-checked at
+# most every FRONTEND_INDEX_RECHECK_S seconds; a rebuild replaces those
+# entries, which triggers a rescan.
+_FileIndex = Dict[str, Tuple[str, os.stat_result]]
+_files: _FileIndex = {}
+# Small top-level files (favicon.ico, robots.txt, manifest, ...) are requested on
+# nearly every visit and, unlike hashed assets, revalidated hourly: keep them in
+# memory as prebuilt (200 response, 304 response, etag), like index.html
+_INLINE_MAX_BYTES = 64 * 1024
+_inline_files: Dict[str, Tuple[Response, Response, str]] = {}
+_files_dir_mtimes: Optional[Tuple[Optional[int], ...]] = None
+_files_checked_at = float("-inf")
+
+
+def _dist_dir_mtimes() -> Tuple[Optional[int], ...]:
+    mtimes = []
+    for directory in (FRONTEND_DIR, FRONTEND_DIR / "assets"):
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _scan_dist() -> _FileIndex:
+    files: _FileIndex = {}
+    for dirpath, _, filenames in os.walk(_DIST_ROOT):
+        for name in filenames:
+            full_path = os.path.join(dirpath, name)
+            try:
+                files[full_path[len(_DIST_ROOT):]] = (full_path, os.stat(full_path))
+            except OSError:
+                continue
+    return files
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"{context}FRONTEND_EXCEPTION: Unexpected error serving root - {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
 
+def _load_inline_files(files: _FileIndex) -> Dict[str, Tuple[Response, Response, str]]:
+    inline = {}
+    for rel_path, (full_path, stat) in files.items():
+        suffix = os.path.splitext(rel_path)[1].lower()
+        if (
+            os.sep in rel_path
+            or rel_path == INDEX_FILE.name
+            or suffix in (".br", ".gz")
+            or stat.st_size > _INLINE_MAX_BYTES
+        ):
+            continue
+        try:
+            with open(full_path, "rb") as file:
+                body = file.read()
+        except OSError:
+            continue
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        headers = {"etag": etag, "cache-control": _STATIC_CACHE_CONTROL}
+        inline[rel_path] = (
+            Response(content=body, media_type=_MEDIA_TYPES.get(suffix), headers=headers),
+            Response(status_code=304, headers=headers),
+            etag,
+        )
+    return inline
 
-@router.get("/{full_path:path}", response_class=HTMLResponse)
-async def serve_react_app(request: Request, full_path: str):
-    """Serve React app for client-side routing (SPA support).
 
-    This handler blocks api/docs paths and otherwise returns the built
-    `index.html` so the client-side router can handle the route. If the
-    frontend is not built, return 404 with a clear message.
+def _file_index() -> _FileIndex:
+    """Return the dist/ listing, rescanning it when the build was replaced."""
+    global _files, _inline_files, _files_dir_mtimes, _files_checked_at
+    now = time.monotonic()
+    if now - _files_checked_at < _INDEX_RECHECK_S:
+        return _files
+    _files_checked_at = now
+
+    mtimes = _dist_dir_mtimes()
+    if mtimes != _files_dir_mtimes:
+        _files = _scan_dist()
+        _inline_files = _load_inline_files(_files)
+        _files_dir_mtimes = mtimes
+        logger.info("%sFRONTEND_FILES: Indexed %d built files", _CTX, len(_files))
+    return _files
+
+
+_file_index()
+
+
+def _is_spa_route(path: str) -> bool:
+    """True for client-side routes: not reserved, and not file-like (no extension)."""
+    return not (path in _BLOCKED_EXACT or path.startswith(_BLOCKED_PREFIXES) or os.path.splitext(path)[1])
+
+
+class ZeroCopyFileResponse(FileResponse):
     """
-    context = build_log_context()
+    FileResponse that hands the open file to the server when it supports
+    the ASGI `http.response.zerocopysend` extension, so the kernel sends it
+    (sendfile) and the bytes never pass through Python.
 
+    Falls back to FileResponse (which already uses `http.response.pathsend`
+    where available) for HEAD and Range requests, unknown sizes, and servers
+    without the extension.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        extensions = scope.get("extensions") or {}
+        if (
+            "http.response.zerocopysend" not in extensions
+            or "http.response.pathsend" in extensions
+            or self.stat_result is None
+            or scope["method"].upper() == "HEAD"
+            or "range" in Headers(scope=scope)
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        with open(self.path, "rb") as file:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": file,
+                "count": self.stat_result.st_size,
+                "more_body": False,
+            })
+        if self.background is not None:
+            await self.background()
+
+
+class SPAStaticFiles(StaticFiles):
+    """
+    StaticFiles for the built frontend with a client-side routing fallback.
+
+    Real files are served by Starlette's ASGI file path (FileResponse, with
+    ETag/Last-Modified conditional GETs) without going through FastAPI's
+    routing, validation and dependency machinery. Unknown extensionless paths
+    get the cached index.html so the React router can handle them; reserved
+    and file-like misses stay 404.
+    """
+
+    async def check_config(self) -> None:
+        # The frontend may be built after startup; a missing dist/ simply 404s
+        if os.path.isdir(self.directory):
+            await super().check_config()
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        """
+        Map a request path onto dist/ through the startup file index.
+
+        Starlette's version realpath()s both the file and the directory and then
+        stat()s the file on every request. Only files that exist in the build
+        are indexed, so traversal attempts and scanner junk miss the dict and
+        no syscall is made.
+        """
+        return _file_index().get(path) or ("", None)
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        full_path = str(full_path)
+        inline = _inline_files.get(full_path[len(_DIST_ROOT):]) if status_code == 200 else None
+        if inline is not None:
+            full, not_modified, etag = inline
+            if Headers(scope=scope).get("if-none-match") == etag:
+                return not_modified
+            return full
+        suffix = os.path.splitext(full_path)[1].lower()
+        media_type = _MEDIA_TYPES.get(suffix)
+        headers = {
+            "cache-control": (
+                _IMMUTABLE_CACHE_CONTROL if full_path.startswith(_ASSETS_DIR) else _STATIC_CACHE_CONTROL
+            ),
+        }
+        etag_suffix = ""
+        if _ACCEL_REDIRECT_PREFIX:
+            # The proxy sendfile()s the file itself (and can pick a .gz sibling
+            # with gzip_static); Python only answers with headers
+            headers["etag"] = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+            headers["x-accel-redirect"] = _ACCEL_REDIRECT_PREFIX + quote(
+                full_path[len(_DIST_ROOT):].replace(os.sep, "/")
+            )
+            response = Response(status_code=status_code, headers=headers, media_type=media_type)
+            if self.is_not_modified(response.headers, Headers(scope=scope)):
+                return NotModifiedResponse(response.headers)
+            return response
+        if suffix in _COMPRESSIBLE_SUFFIXES:
+            headers["vary"] = "Accept-Encoding"
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            files = _file_index()
+            for token, encoded_suffix in _ENCODINGS:
+                if token not in accept_encoding:
+                    continue
+                encoded = files.get(full_path[len(_DIST_ROOT):] + encoded_suffix)
+                if encoded is None:
+                    continue
+                encoded_stat = encoded[1]
+                if encoded_stat.st_mtime_ns < stat_result.st_mtime_ns:
+                    continue  # stale sibling from an earlier build
+                # Same content type as the original, sent as the encoded bytes
+                full_path += encoded_suffix
+                stat_result = encoded_stat
+                headers["content-encoding"] = token
+                etag_suffix = "-" + token
+                break
+        # The ETag comes straight from size + mtime (cheaper than Starlette's MD5
+        # of the same data); it stays strong-form because StaticFiles' If-None-Match
+        # check only normalizes W/ on the request side
+        headers["etag"] = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}{etag_suffix}"'
+        response = ZeroCopyFileResponse(
+            full_path, status_code=status_code, headers=headers, stat_result=stat_result, media_type=media_type
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    async def get_response(self, path: str, scope) -> Response:
+        if os.path.splitext(path)[1] and path not in _file_index():
+            # File-like miss (scanner junk such as /wp-login.php, stale chunk
+            # names): 404 straight away, without the html/404.html probing or
+            # the SPA fallback
+            raise StarletteHTTPException(status_code=404)
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as exc:
+            if exc.status_code != 404 or not _is_spa_route(path):
+                raise
+            index = _index_response(Request(scope))
+            if index is None:
+                logger.warning("%sFRONTEND_NOT_BUILT: SPA index file not present - %s", _CTX, INDEX_PATH)
+                raise StarletteHTTPException(status_code=404, detail="FRONTEND_NOT_AVAILABLE")
+            logger.debug("%sFRONTEND_SUCCESS: Serving SPA index.html for route - /%s", _CTX, path, extra={"sanitize": True})
+            return index
+
+
+spa_files = SPAStaticFiles(directory=str(FRONTEND_DIR), html=True, check_dir=False)
+
+
+# The root route is always registered. At request-time we check for the built
+# `index.html` and serve it when available; if not available return a clear 404.
+# Every other frontend path is handled by `spa_files`.
+@router.get("/", include_in_schema=False)
+async def serve_root(request: Request):
+    """Serve the main React application index.html file if present, otherwise 404."""
     try:
-        logger.debug(f"{context}FRONTEND_REQUEST: Serving SPA route - /{sanitize_log_data(full_path)}")
-
-        # Block API and documentation routes
-        blocked_paths = ["api", "docs", "redoc", "openapi.json"]
-        if full_path.startswith("api") or full_path in blocked_paths:
-            logger.info(f"{context}FRONTEND_BLOCKED: Blocked access to reserved path - /{sanitize_log_data(full_path)}")
-            raise HTTPException(status_code=404, detail="NOT_FOUND")
-
-        # First try to serve a real file from the built frontend directory
-        # (covers /assets/* and top-level files like favicon.ico). If the
-        # requested path maps to a file under `dist`, return it with a proper
-        # content type. Otherwise fall back to serving index.html for SPA
-        # routes so the client-side router can handle them.
-        target_file = (FRONTEND_DIR / full_path).resolve() if full_path else None
-
-        if target_file and target_file.exists() and target_file.is_file():
-            # Guard: ensure the target file is inside the FRONTEND_DIR to
-            # avoid directory traversal.
-            try:
-                target_file.relative_to(FRONTEND_DIR)
-            except Exception:
-                logger.warning(f"{context}FRONTEND_SECURITY: Attempted access outside frontend dir - {sanitize_log_data(str(target_file))}")
-                raise HTTPException(status_code=404, detail="NOT_FOUND")
-            media_type, _ = mimetypes.guess_type(str(target_file))
-            # Provide reasonable defaults for common types if guess fails
-            if not media_type:
-                suffix = target_file.suffix.lower()
-                if suffix == ".js":
-                    media_type = "application/javascript"
-                elif suffix == ".css":
-                    media_type = "text/css"
-                elif suffix == ".svg":
-                    media_type = "image/svg+xml"
-                elif suffix == ".json":
-                    media_type = "application/json"
-                elif suffix == ".wasm":
-                    media_type = "application/wasm"
-                elif suffix == ".ico":
-                    media_type = "image/x-icon"
-                else:
-                    media_type = "application/octet-stream"
-
-            logger.info(f"{context}FRONTEND_SUCCESS: Serving static file for route - /{sanitize_log_data(full_path)} (media_type={media_type})")
-            return FileResponse(path=str(target_file), media_type=media_type)
-
-        # No matching static file; serve the SPA index if present so client-side
-        # routing can take over for paths like /login, /app/xxx, etc.
-        index_file = FRONTEND_DIR / "index.html"
-
-        # If the requested path looks like a file (has an extension) but we did
-        # not find it in the dist folder, return 404 instead of index.html. If
-        # it's a client route (no file extension), fall back to index.html so
-        # the client-side router can render it.
-        if full_path and Path(full_path).suffix:
-            logger.warning(f"{context}FRONTEND_NOT_FOUND: Static file not found - /{sanitize_log_data(full_path)}")
-            raise HTTPException(status_code=404, detail="FRONTEND_FILE_NOT_FOUND")
-
-        if index_file.exists():
-            logger.info(f"{context}FRONTEND_SUCCESS: Serving SPA index.html for route - /{sanitize_log_data(full_path)}")
-            content = index_file.read_text(encoding="utf-8")
-            logger.debug(f"{context}FRONTEND_CONTENT: Index file size - {len(content)} characters")
-            return HTMLResponse(content=content)
-
-        logger.warning(f"{context}FRONTEND_NOT_BUILT: SPA index file not present - {sanitize_log_data(str(index_file))}")
-        # Still block API-like paths above; for other paths when index.html is
-        # missing we return a 404 indicating frontend is not available.
+        logger.debug("%sFRONTEND_REQUEST: Serving root path - /", _CTX)
+
+        response = _index_response(request)
+
+        if response is not None:
+            logger.info("%sFRONTEND_SUCCESS: Serving index.html from %s", _CTX, INDEX_PATH)
+            return response
+
+        logger.warning("%sFRONTEND_NOT_BUILT: Index file not present - %s", _CTX, INDEX_PATH)
         raise HTTPException(status_code=404, detail="FRONTEND_NOT_AVAILABLE")
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"{context}FRONTEND_EXCEPTION: Unexpected error serving SPA route /{sanitize_log_data(full_path)} - {str(e)}")
+        logger.error("%sFRONTEND_EXCEPTION: Unexpected error serving root - %s", _CTX, e)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -5,18 +5,21 @@ This module provides REST API endpoints for goal template header management
 with proper validation, error handling, and service layer integration.
 """
 
+import logging
+
 from fastapi import APIRouter, Depends, status, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.db.database import get_db
+from app.db.database import get_db, relax_commit_durability
 from app.models.employee import Employee
 from app.schemas.goal import (
     GoalTemplateHeaderCreate,
     GoalTemplateHeaderUpdate,
     GoalTemplateHeaderResponse,
     GoalTemplateHeaderWithTemplates,
-    GoalTemplateTypeEnum
+    GoalTemplateHeaderFilter
 )
 from app.routers.auth import get_current_user, get_current_active_user
 from app.utils.logger import get_logger, log_execution_time, build_log_context
@@ -25,15 +28,17 @@ from app.exceptions.domain_exceptions import (
     map_domain_exception_to_http_status
 )
 from app.services.goal_template_header_service import GoalTemplateHeaderService
+from app.dependencies.services import get_header_service
+from app.utils.schema_utils import validated_json
+from app.utils.catalog_cache import cached_json_response, headers_cache, invalidate_catalog_caches
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 logger = get_logger(__name__)
 
-
-# Dependency provider
-def get_header_service() -> GoalTemplateHeaderService:
-    """Dependency to get goal template header service instance."""
-    return GoalTemplateHeaderService()
+# Validates a whole list of ORM headers (and their nested templates) in a
+# single pydantic-core call
+_HeaderListAdapter = TypeAdapter(List[GoalTemplateHeaderWithTemplates])
+_HeaderAdapter = TypeAdapter(GoalTemplateHeaderWithTemplates)
 
 
 @router.post("/", response_model=GoalTemplateHeaderResponse, status_code=status.HTTP_201_CREATED)
@@ -64,7 +69,10 @@ async def create_header(
     logger.info(f"{context}ROUTER_CREATE_HEADER: Creating header - Role ID: {header_data.role_id}, Title: {header_data.title}")
 
     try:
+        await relax_commit_durability(db)
         header = await service.create(db, obj_in=header_data, current_user=current_user)
+        await db.commit()
+        invalidate_catalog_caches()
 
         logger.info(f"{context}ROUTER_CREATE_HEADER_SUCCESS: Created header - ID: {header.header_id}")
         return GoalTemplateHeaderResponse.model_validate(header)
@@ -105,11 +113,19 @@ async def get_headers_by_role(
 
     logger.info(f"{context}ROUTER_GET_HEADERS_BY_ROLE: Getting headers for role - Role ID: {role_id}")
 
+    cache_key = ("role", role_id)
+    cached = headers_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("%sROUTER_GET_HEADERS_BY_ROLE_CACHE_HIT: Role ID: %s", context, role_id)
+        return cached_json_response(cached)
+
     try:
         headers = await service.get_by_role_id(db, role_id, include_templates=True)
 
         logger.info(f"{context}ROUTER_GET_HEADERS_BY_ROLE_SUCCESS: Retrieved {len(headers)} headers")
-        return [GoalTemplateHeaderWithTemplates.model_validate(h) for h in headers]
+        response = validated_json(_HeaderListAdapter, headers)
+        headers_cache.put(cache_key, response.body)
+        return response
 
     except BaseDomainException as e:
         status_code = map_domain_exception_to_http_status(e)
@@ -151,7 +167,7 @@ async def get_header(
         header = await service.get_header_with_templates(db, header_id)
 
         logger.info(f"{context}ROUTER_GET_HEADER_SUCCESS: Retrieved header {header_id}")
-        return GoalTemplateHeaderWithTemplates.model_validate(header)
+        return validated_json(_HeaderAdapter, header)
 
     except BaseDomainException as e:
         status_code = map_domain_exception_to_http_status(e)
@@ -199,55 +215,30 @@ async def get_all_headers(
 
     logger.info(f"{context}ROUTER_GET_ALL_HEADERS: Getting headers - Skip: {skip}, Limit: {limit}, Filter: {filter_type}, App Role ID: {application_role_id}")
 
+    # 'self' and 'shared' depend on the caller; every other listing is shared by all users
+    user_key = current_user.emp_id if filter_type in ("self", "shared") else None
+    cache_key = ("all", application_role_id or None, filter_type, user_key, search, skip, limit)
+    cached = headers_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("%sROUTER_GET_ALL_HEADERS_CACHE_HIT", context)
+        return cached_json_response(cached)
+
     try:
-        # If application_role_id is provided, filter by it
-        if application_role_id:
-            headers = await service.get_by_application_role_id(
-                db,
-                application_role_id,
-                include_templates=True,
-                skip=skip,
-                limit=limit,
-                search=search
-            )
-        # Apply filtering based on filter_type — always pass pagination and search so results are coordinated
-        elif filter_type == "organization":
-            headers = await service.get_by_type(
-                db,
-                GoalTemplateTypeEnum.ORGANIZATION,
-                include_templates=True,
-                skip=skip,
-                limit=limit,
-                search=search,
-            )
-        elif filter_type == "self":
-            logger.debug(f"{context}ROUTER_GET_SELF_HEADERS: User emp_id={current_user.emp_id}, role_id={current_user.role_id}")
-            headers = await service.get_self_headers_for_user(
-                db,
-                current_user.emp_id,
-                current_user.role_id,
-                include_templates=True,
-                skip=skip,
-                limit=limit,
-                search=search,
-            )
-        elif filter_type == "shared":
-            logger.debug(f"{context}ROUTER_GET_SHARED_HEADERS: User emp_id={current_user.emp_id}, role_id={current_user.role_id}")
-            headers = await service.get_shared_with_user(
-                db,
-                current_user.emp_id,
-                current_user.role_id,
-                include_templates=True,
-                skip=skip,
-                limit=limit,
-                search=search,
-            )
-        else:
-            # No filter, get all headers
-            headers = await service.get_all_with_templates(db, skip=skip, limit=limit, search=search)
+        # Every filter (and combinations of them) is answered by one query
+        filters = GoalTemplateHeaderFilter(
+            application_role_id=application_role_id or None,
+            filter_type=filter_type,
+            user_emp_id=current_user.emp_id,
+            search=search,
+            skip=skip,
+            limit=limit,
+        )
+        headers = await service.list_headers(db, filters)
 
         logger.info(f"{context}ROUTER_GET_ALL_HEADERS_SUCCESS: Retrieved {len(headers)} headers")
-        return [GoalTemplateHeaderWithTemplates.model_validate(h) for h in headers]
+        response = validated_json(_HeaderListAdapter, headers)
+        headers_cache.put(cache_key, response.body)
+        return response
 
     except BaseDomainException as e:
         status_code = map_domain_exception_to_http_status(e)
@@ -289,8 +280,13 @@ async def update_header(
 
     try:
         # Log incoming update payload for debugging
-        logger.debug(f"{context}ROUTER_UPDATE_HEADER_PAYLOAD: {header_data.model_dump()}")
+        # model_dump() is only worth paying for when the line is emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%sROUTER_UPDATE_HEADER_PAYLOAD: %s", context, header_data.model_dump())
+        await relax_commit_durability(db)
         header = await service.update(db, header_id=header_id, obj_in=header_data, current_user=current_user)
+        await db.commit()
+        invalidate_catalog_caches()
 
         logger.info(f"{context}ROUTER_UPDATE_HEADER_SUCCESS: Updated header {header_id}")
         return GoalTemplateHeaderResponse.model_validate(header)
@@ -324,7 +320,10 @@ async def clone_header_to_self(
     logger.info(f"{context}ROUTER_CLONE_HEADER_TO_SELF: Cloning header {header_id} to Self for user {getattr(current_user,'emp_id',None)}")
 
     try:
+        await relax_commit_durability(db)
         new_header = await service.clone_organization_to_self(db, header_id, current_user)
+        await db.commit()
+        invalidate_catalog_caches()
         logger.info(f"{context}ROUTER_CLONE_HEADER_TO_SELF_SUCCESS: Cloned header to {new_header.header_id}")
         return GoalTemplateHeaderResponse.model_validate(new_header)
 
@@ -370,7 +369,10 @@ async def delete_header(
     logger.info(f"{context}ROUTER_DELETE_HEADER: Deleting header - Header ID: {header_id}")
 
     try:
+        await relax_commit_durability(db)
         success = await service.delete(db, header_id=header_id, current_user=current_user)
+        await db.commit()
+        invalidate_catalog_caches()
 
         if not success:
             logger.error(f"{context}ROUTER_DELETE_HEADER_FAILED: Failed to delete header {header_id}")
@@ -6,11 +6,17 @@ with proper validation, error handling, and service layer integration.
 """
 
 from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from sqlalchemy.orm import raiseload, selectinload
+from typing import Any, AsyncIterator, Callable, List, Optional
 
-from app.db.database import get_db
+import orjson
+
+from app.db.database import get_db, async_session, relax_commit_durability
 from app.models.employee import Employee
+from app.models.goal import Goal, GoalTemplate
 from app.schemas.goal import (
     GoalTemplateCreate,
     GoalTemplateUpdate,
@@ -18,6 +24,7 @@ from app.schemas.goal import (
     GoalCreate,
     GoalUpdate,
     GoalResponse,
+    GoalBulkDelete,
     CategoryCreate,
     CategoryResponse,
     AppraisalGoalCreate,
@@ -25,11 +32,13 @@ from app.schemas.goal import (
     AppraisalGoalResponse
 )
 from app.routers.auth import get_current_user, get_current_active_user
-from app.dependencies import (
-    get_pagination_params,
-    PaginationParams
-)
+from app.dependencies import SkipParam, LimitParam
 from app.utils.logger import get_logger, log_execution_time, log_exception, build_log_context, sanitize_log_data
+from app.utils.schema_utils import (
+    dump_from_orm, orm_list_response, orm_response, strict_response_validation, validated_json
+)
+from app.utils.catalog_cache import cached_json_response, catalog_cache, invalidate_catalog_caches
+from app.core.config import settings
 from app.exceptions.domain_exceptions import (
     BaseDomainException, BaseServiceException, BaseRepositoryException,
     map_domain_exception_to_http_status
@@ -41,30 +50,79 @@ from app.services.goal_service import (
     AppraisalGoalService,
     
 )
+from app.dependencies.services import (
+    get_goal_template_service,
+    get_goal_service,
+    get_category_service,
+    get_appraisal_goal_service,
+)
 
-router = APIRouter(dependencies=[Depends(get_current_user)])
+router = APIRouter(default_response_class=ORJSONResponse, dependencies=[Depends(get_current_user)])
 logger = get_logger(__name__)
 
 
-# Dependency providers
-def get_goal_template_service() -> GoalTemplateService:
-    """Dependency to get goal template service instance."""
-    return GoalTemplateService()
+# Validate a whole list of ORM rows in a single pydantic-core call, built once
+# at import time rather than per request
+_CategoryListAdapter = TypeAdapter(List[CategoryResponse])
+_GoalListAdapter = TypeAdapter(List[GoalResponse])
+_GoalTemplateListAdapter = TypeAdapter(List[GoalTemplateResponse])
+_GoalAdapter = TypeAdapter(GoalResponse)
+_GoalTemplateAdapter = TypeAdapter(GoalTemplateResponse)
+
+
+def _goal_response(goal: Goal, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """Render a written goal, with category_ids filled in from its loaded categories."""
+    data = dump_from_orm(GoalResponse, goal)
+    data["category_ids"] = [category["id"] for category in data["categories"]]
+    if strict_response_validation():
+        return validated_json(_GoalAdapter, data, status_code)
+    return ORJSONResponse(data, status_code=status_code)
 
 
-def get_goal_service() -> GoalService:
-    """Dependency to get goal service instance."""
-    return GoalService()
+# GoalResponse needs a goal's columns and categories only: load the categories
+# in one IN query and make any other relationship access fail fast instead of
+# silently issuing a query per row
+_GOAL_LIST_LOAD_OPTIONS = [selectinload(Goal.categories), raiseload("*")]
 
 
-def get_category_service() -> CategoryService:
-    """Dependency to get category service instance."""
-    return CategoryService()
+# Templates are always returned with their categories
+_TEMPLATE_LIST_LOAD_OPTIONS = [selectinload(GoalTemplate.categories)]
 
+# Pages larger than this are streamed row by row instead of built in memory
+_STREAM_THRESHOLD = getattr(settings, "GOAL_STREAM_THRESHOLD", None) or 200
 
-def get_appraisal_goal_service() -> AppraisalGoalService:
-    """Dependency to get appraisal goal service instance."""
-    return AppraisalGoalService()
+
+def _category_dict(category) -> dict:
+    return {"id": getattr(category, "id", None), "name": getattr(category, "name", None)}
+
+
+def _should_stream(limit: int) -> bool:
+    return limit > _STREAM_THRESHOLD and not strict_response_validation()
+
+
+async def _stream_json(
+    service,
+    skip: int,
+    limit: int,
+    render: Callable[[Any], dict],
+    load_options: Optional[List[Any]],
+    context: str,
+    label: str
+) -> AsyncIterator[bytes]:
+    """Yield a JSON array of rendered rows, one row at a time.
+
+    Uses its own session: the request session is committed and closed as
+    soon as the response starts, before a StreamingResponse body is iterated.
+    """
+    count = 0
+    async with async_session() as session:
+        yield b"["
+        async for row in service.stream_multi(session, skip=skip, limit=limit, load_options=load_options):
+            chunk = orjson.dumps(render(row))
+            yield chunk if count == 0 else b"," + chunk
+            count += 1
+        yield b"]"
+    logger.info("%sAPI_SUCCESS: Streamed %s %s", context, count, label)
 
 
 # Categories endpoints
@@ -96,12 +154,14 @@ async def create_category(
     logger.info(f"{context}API_REQUEST: POST /categories - Name: {category.name}")
     
     try:
+        await relax_commit_durability(db)
         db_category = await category_service.create(db, obj_in=category)
         await db.commit()
+        invalidate_catalog_caches()
 
         logger.info(f"{context}API_SUCCESS: Created category - ID: {db_category.id}")
-        # Return plain dict to avoid Pydantic validation issues when converting ORM objects
-        return {"id": getattr(db_category, "id", None), "name": getattr(db_category, "name", None)}
+        # Plain dict straight to orjson; skips the response_model round-trip
+        return ORJSONResponse(_category_dict(db_category), status_code=status.HTTP_201_CREATED)
         
     except BaseDomainException as e:
         # Convert domain exceptions to HTTP exceptions
@@ -132,7 +192,8 @@ async def create_category(
 @router.get("/categories", response_model=List[CategoryResponse])
 async def get_categories(
     db: AsyncSession = Depends(get_db),
-    pagination: PaginationParams = Depends(get_pagination_params),
+    skip: SkipParam = 0,
+    limit: LimitParam = 100,
     category_service: CategoryService = Depends(get_category_service),
     current_user: Employee = Depends(get_current_active_user)
 ) -> List[CategoryResponse]:
@@ -141,7 +202,8 @@ async def get_categories(
     
     Args:
         db: Database session
-        pagination: Pagination parameters
+        skip: Number of records to skip
+        limit: Number of records to return
         category_service: Category service instance
         current_user: Current authenticated user
         
@@ -154,18 +216,35 @@ async def get_categories(
     user_id = current_user.emp_id
     context = build_log_context(user_id=str(user_id))
     
-    logger.info(f"{context}API_REQUEST: GET /categories - skip: {pagination.skip}, limit: {pagination.limit}")
+    logger.info(f"{context}API_REQUEST: GET /categories - skip: {skip}, limit: {limit}")
     
+    if _should_stream(limit):
+        return StreamingResponse(
+            _stream_json(category_service, skip, limit, _category_dict, None, context, "categories"),
+            media_type="application/json"
+        )
+
+    cache_key = ("categories", skip, limit)
+    cached = catalog_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("%sAPI_CACHE_HIT: GET /categories", context)
+        return cached_json_response(cached)
+
     try:
         categories = await category_service.get_multi(
             db,
-            skip=pagination.skip,
-            limit=pagination.limit
+            skip=skip,
+            limit=limit
         )
 
         logger.info(f"{context}API_SUCCESS: Retrieved {len(categories)} categories")
-        # Convert ORM objects to plain dicts to avoid unexpected serialization errors
-        return [{"id": getattr(cat, "id", None), "name": getattr(cat, "name", None)} for cat in categories]
+        if strict_response_validation():
+            response = validated_json(_CategoryListAdapter, categories)
+        else:
+            # Plain dicts straight to orjson; skips the response_model round-trip
+            response = ORJSONResponse([_category_dict(cat) for cat in categories])
+        catalog_cache.put(cache_key, response.body)
+        return response
         
     except BaseDomainException as e:
         # Convert domain exceptions to HTTP exceptions
@@ -209,8 +288,10 @@ async def delete_category(
     logger.info(f"{context}API_REQUEST: DELETE /categories/{category_id}")
 
     try:
+        await relax_commit_durability(db)
         await category_service.delete(db, entity_id=category_id)
         await db.commit()
+        invalidate_catalog_caches()
 
         logger.info(f"{context}API_SUCCESS: Deleted category - ID: {category_id}")
 
@@ -269,14 +350,16 @@ async def create_goal_template(
     logger.info(f"{context}API_REQUEST: POST /templates - Title: {goal_template.temp_title}")
     
     try:
+        await relax_commit_durability(db)
         db_template = await template_service.create_template_with_categories(
             db, 
             template_data=goal_template
         )
         await db.commit()
+        invalidate_catalog_caches()
         
         logger.info(f"{context}API_SUCCESS: Created goal template - ID: {db_template.temp_id}")
-        return GoalTemplateResponse.model_validate(db_template)
+        return orm_response(GoalTemplateResponse, _GoalTemplateAdapter, db_template, status.HTTP_201_CREATED)
         
     except BaseDomainException as e:
         # Convert domain exceptions to HTTP exceptions
@@ -306,8 +389,8 @@ async def create_goal_template(
 
 @router.get("/templates", response_model=List[GoalTemplateResponse])
 async def read_goal_templates(
-    skip: int = 0,
-    limit: int = 100,
+    skip: SkipParam = 0,
+    limit: LimitParam = 100,
     db: AsyncSession = Depends(get_db),
     current_user: Employee = Depends(get_current_active_user),
     template_service: GoalTemplateService = Depends(get_goal_template_service)
@@ -332,11 +415,29 @@ async def read_goal_templates(
     
     logger.info(f"{context}API_REQUEST: GET /templates - skip: {skip}, limit: {limit}")
     
+    if _should_stream(limit):
+        return StreamingResponse(
+            _stream_json(
+                template_service, skip, limit,
+                lambda template: dump_from_orm(GoalTemplateResponse, template),
+                _TEMPLATE_LIST_LOAD_OPTIONS, context, "goal templates"
+            ),
+            media_type="application/json"
+        )
+
+    cache_key = ("templates", skip, limit)
+    cached = catalog_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("%sAPI_CACHE_HIT: GET /templates", context)
+        return cached_json_response(cached)
+
     try:
         goal_templates = await template_service.get_goal_template(db, skip, limit)
         
         logger.info(f"{context}API_SUCCESS: Retrieved {len(goal_templates)} goal templates")
-        return [GoalTemplateResponse.model_validate(template) for template in goal_templates]
+        response = orm_list_response(GoalTemplateResponse, _GoalTemplateListAdapter, goal_templates)
+        catalog_cache.put(cache_key, response.body)
+        return response
         
     except BaseDomainException as e:
         # Convert domain exceptions to HTTP exceptions
@@ -443,7 +544,7 @@ async def get_templates_by_role(
         templates = await template_service.get_templates_by_role(db, role_id)
 
         logger.info(f"{context}API_SUCCESS: Retrieved {len(templates)} templates for role {role_id}")
-        return [GoalTemplateResponse.model_validate(t) for t in templates]
+        return orm_list_response(GoalTemplateResponse, _GoalTemplateListAdapter, templates)
 
     except BaseDomainException as e:
         status_code = map_domain_exception_to_http_status(e)
@@ -500,12 +601,14 @@ async def update_goal_template(
     logger.info(f"{context}API_REQUEST: PUT /templates/{template_id}")
     
     try:
+        await relax_commit_durability(db)
         updated_template = await template_service.update_template_with_categories(
             db,
             template_id=template_id,
             template_data=goal_template
         )
         await db.commit()
+        invalidate_catalog_caches()
         
         logger.info(f"{context}API_SUCCESS: Updated goal template - ID: {template_id}")
         return GoalTemplateResponse.model_validate(updated_template)
@@ -561,8 +664,10 @@ async def delete_goal_template(
     logger.info(f"{context}API_REQUEST: DELETE /templates/{template_id}")
     
     try:
+        await relax_commit_durability(db)
         await template_service.delete(db, entity_id=template_id)
         await db.commit()
+        invalidate_catalog_caches()
         
         logger.info(f"{context}API_SUCCESS: Deleted goal template - ID: {template_id}")
         
@@ -621,26 +726,14 @@ async def create_goal(
     logger.info(f"{context}API_REQUEST: POST /goals - Title: {goal.goal_title}")
     
     try:
-        db_goal = await goal_service.create(db, obj_in=goal, current_user=current_user)
+        await relax_commit_durability(db)
+        final_goal = await goal_service.create(db, obj_in=goal, current_user=current_user)
         await db.commit()
 
-        # Reload the goal with categories relationship to avoid lazy-load IO outside
-        # the async context (this prevents greenlet_spawn errors when accessing
-        # relationship attributes).
-        final_goal = await goal_service.get_by_id_or_404(db, db_goal.goal_id, load_relationships=["categories"])
-
-        # Convert loaded relationships into response fields
-        if getattr(final_goal, "categories", None) is not None:
-            category_ids = [c.id for c in getattr(final_goal, "categories", [])]
-            categories = [CategoryResponse.model_validate(c) for c in getattr(final_goal, "categories", [])]
-        else:
-            category_ids = [] if final_goal.category_id is None else [final_goal.category_id]
-            categories = []
-
-        result_dict = {**{k: v for k, v in final_goal.__dict__.items() if not k.startswith('_')}, "category_ids": category_ids, "categories": categories}
-
+        # No reload needed: the repository returns the goal with its columns and
+        # categories already loaded, and the session does not expire on commit.
         logger.info(f"{context}API_SUCCESS: Created goal - ID: {final_goal.goal_id}")
-        return GoalResponse.model_validate(result_dict)
+        return _goal_response(final_goal, status_code=status.HTTP_201_CREATED)
         
     except BaseDomainException as e:
         # Convert domain exceptions to HTTP exceptions
@@ -671,7 +764,8 @@ async def create_goal(
 @router.get("/", response_model=List[GoalResponse])
 async def get_goals(
     db: AsyncSession = Depends(get_db),
-    pagination: PaginationParams = Depends(get_pagination_params),
+    skip: SkipParam = 0,
+    limit: LimitParam = 100,
     goal_service: GoalService = Depends(get_goal_service),
     current_user: Employee = Depends(get_current_active_user)
 ) -> List[GoalResponse]:
@@ -680,7 +774,8 @@ async def get_goals(
     
     Args:
         db: Database session
-        pagination: Pagination parameters
+        skip: Number of records to skip
+        limit: Number of records to return
         goal_service: Goal service instance
         current_user: Current authenticated user
         
@@ -693,17 +788,28 @@ async def get_goals(
     user_id = current_user.emp_id
     context = build_log_context(user_id=str(user_id))
     
-    logger.info(f"{context}API_REQUEST: GET /goals - skip: {pagination.skip}, limit: {pagination.limit}")
+    logger.info(f"{context}API_REQUEST: GET /goals - skip: {skip}, limit: {limit}")
     
+    if _should_stream(limit):
+        return StreamingResponse(
+            _stream_json(
+                goal_service, skip, limit,
+                lambda goal: dump_from_orm(GoalResponse, goal),
+                _GOAL_LIST_LOAD_OPTIONS, context, "goals"
+            ),
+            media_type="application/json"
+        )
+
     try:
         goals = await goal_service.get_multi(
             db,
-            skip=pagination.skip,
-            limit=pagination.limit
+            skip=skip,
+            limit=limit,
+            load_options=_GOAL_LIST_LOAD_OPTIONS
         )
         
         logger.info(f"{context}API_SUCCESS: Retrieved {len(goals)} goals")
-        return [GoalResponse.model_validate(goal) for goal in goals]
+        return orm_list_response(GoalResponse, _GoalListAdapter, goals)
         
     except BaseDomainException as e:
         # Convert domain exceptions to HTTP exceptions
@@ -820,25 +926,13 @@ async def update_goal(
     logger.info(f"{context}API_REQUEST: PUT /goals/{goal_id}")
     
     try:
-        db_goal = await goal_service.get_by_id_or_404(db, goal_id)
-        await goal_service.update(db, db_obj=db_goal, obj_in=goal)
+        # One UPDATE ... RETURNING; the returned goal has its categories loaded
+        await relax_commit_durability(db)
+        final_goal = await goal_service.update_by_id(db, goal_id, goal)
         await db.commit()
         
-        # Reload the goal with relationships for the response
-        final_goal = await goal_service.get_by_id_or_404(db, goal_id, load_relationships=["categories"])
-        
         logger.info(f"{context}API_SUCCESS: Updated goal - ID: {goal_id}")
-        # Convert category relationships into response fields
-        if getattr(final_goal, "categories", None) is not None:
-            category_ids = [c.id for c in getattr(final_goal, "categories", [])]
-            categories = [CategoryResponse.model_validate(c) for c in getattr(final_goal, "categories", [])]
-        else:
-            category_ids = [] if final_goal.category_id is None else [final_goal.category_id]
-            categories = []
-
-        # Build a serializable dict for validation
-        result_dict = {**{k: v for k, v in final_goal.__dict__.items() if not k.startswith('_')}, "category_ids": category_ids, "categories": categories}
-        return GoalResponse.model_validate(result_dict)
+        return _goal_response(final_goal)
         
     except BaseDomainException as e:
         # Convert domain exceptions to HTTP exceptions
@@ -866,6 +960,68 @@ async def update_goal(
         )
 
 
+# Registered before DELETE /{goal_id} so "bulk" is not matched as a goal ID
+@router.delete("/bulk", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_goals_bulk(
+    payload: GoalBulkDelete,
+    db: AsyncSession = Depends(get_db),
+    goal_service: GoalService = Depends(get_goal_service),
+    current_user: Employee = Depends(get_current_active_user)
+) -> None:
+    """
+    Delete several goals with one DELETE statement and one commit.
+
+    Preferred over repeated DELETE /{goal_id} calls for multi-goal cleanup.
+    IDs that do not exist are ignored; dependent appraisal goals and
+    category links are removed by the database's ON DELETE CASCADE rules.
+    
+    Args:
+        payload: IDs of the goals to delete
+        db: Database session
+        goal_service: Goal service instance
+        current_user: Current authenticated user
+        
+    Raises:
+        HTTPException: Converted from domain exceptions
+    """
+    user_id = current_user.emp_id
+    context = build_log_context(user_id=str(user_id))
+    
+    logger.info(f"{context}API_REQUEST: DELETE /goals/bulk - Count: {len(payload.goal_ids)}")
+    
+    try:
+        await relax_commit_durability(db)
+        deleted = await goal_service.delete_by_ids(db, entity_ids=payload.goal_ids)
+        await db.commit()
+        
+        logger.info(f"{context}API_SUCCESS: Deleted {deleted} goals")
+        
+    except BaseDomainException as e:
+        # Convert domain exceptions to HTTP exceptions
+        status_code = map_domain_exception_to_http_status(e)
+        logger.warning(f"{context}DOMAIN_ERROR: {e.__class__.__name__} - {e.message}")
+        
+        raise HTTPException(
+            status_code=status_code,
+            detail={
+                "error": e.__class__.__name__,
+                "message": e.message,
+                "details": e.details
+            }
+        )
+        
+    except Exception as e:
+        # Handle unexpected errors
+        logger.error(f"{context}UNEXPECTED_ERROR: Failed to bulk delete goals - {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "InternalServerError",
+                "message": "An unexpected error occurred while deleting goals"
+            }
+        )
+
+
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_goal(
     goal_id: int,
@@ -891,6 +1047,7 @@ async def delete_goal(
     logger.info(f"{context}API_REQUEST: DELETE /goals/{goal_id}")
     
     try:
+        await relax_commit_durability(db)
         await goal_service.delete(db, entity_id=goal_id)
         await db.commit()
         
@@ -951,6 +1108,7 @@ async def create_appraisal_goal(
     logger.info(f"{context}API_REQUEST: POST /appraisal-goals - {sanitize_log_data(appraisal_goal.model_dump())}")
     
     try:
+        await relax_commit_durability(db)
         db_appraisal_goal = await appraisal_goal_service.create(db, obj_in=appraisal_goal)
         await db.commit()
         
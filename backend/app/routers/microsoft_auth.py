@@ -33,7 +33,7 @@ router = APIRouter(prefix="/api/auth/microsoft", tags=["microsoft-auth"])
 logger = get_logger(__name__)
 
 
-def get_microsoft_auth_service() -> MicrosoftAuthService:
+async def get_microsoft_auth_service() -> MicrosoftAuthService:
     """Dependency to get Microsoft Auth Service instance."""
     return MicrosoftAuthService()
 
@@ -218,6 +218,18 @@ class GoalTemplateHeaderWithTemplates(GoalTemplateHeaderResponse):
         return v or 0
 
 
+class GoalTemplateHeaderFilter(BaseModel):
+    """Filters for listing goal template headers; unset fields are not applied."""
+
+    application_role_id: Optional[int] = None
+    # 'organization', 'self' (created by user_emp_id) or 'shared' (shared with user_emp_id)
+    filter_type: Optional[str] = None
+    user_emp_id: Optional[int] = None
+    search: Optional[str] = None
+    skip: int = 0
+    limit: int = 100
+
+
 class GoalBase(BaseModel):
     """Base schema for Goal."""
     
@@ -296,6 +308,12 @@ class GoalUpdate(BaseModel):
         return v
 
 
+class GoalBulkDelete(BaseModel):
+    """Schema for deleting several Goals in one request."""
+
+    goal_ids: List[int] = Field(..., min_length=1, max_length=1000, description="IDs of the goals to delete")
+
+
 class GoalResponse(GoalBase):
     """Schema for Goal response."""
     
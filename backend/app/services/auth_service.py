@@ -5,16 +5,24 @@ This module provides authentication and authorization logic
 with proper JWT handling and security.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Union
 from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import hmac
+import time
+import uuid
 import jwt
+import orjson
 from jwt import InvalidTokenError
+from jwt.algorithms import get_default_algorithms
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import insert, select
 from app.models.password_reset_token import PasswordResetToken
 
 from app.models.employee import Employee
-from app.services.employee_service import EmployeeService
+from app.services.employee_service import EmployeeService, DUMMY_PASSWORD_HASH
 from app.core.config import settings
 from app.exceptions import UnauthorizedError, EntityNotFoundError
 from app.constants import (
@@ -35,6 +43,114 @@ from app.utils.logger import (
     log_execution_time,
     log_exception
 )
+from app.utils.ttl_cache import TTLCache
+
+# JWT settings are fixed for the process lifetime: resolve them once instead of
+# per token. The key is prepared up front (SECRET_KEY as bytes for HS*), so PyJWT
+# doesn't re-validate and re-encode it on every encode/decode.
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_JWT_KEY = get_default_algorithms()[_JWT_ALGORITHM].prepare_key(settings.SECRET_KEY)
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+_PASSWORD_RESET_TTL = timedelta(minutes=settings.PASSWORD_RESET_EXPIRE_MINUTES)
+# Session tokens use integer unix timestamps (the on-wire form of exp/iat anyway)
+_ACCESS_TOKEN_TTL_S = int(_ACCESS_TOKEN_TTL.total_seconds())
+_REFRESH_TOKEN_TTL_S = int(_REFRESH_TOKEN_TTL.total_seconds())
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used by JWS compact serialization."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# For HMAC algorithms the JWS header is constant, so it is serialized once and
+# the keyed HMAC state is prepared once; each token then costs one orjson dump
+# of the payload plus an HMAC copy/update. Tokens are standard compact JWS, so
+# jwt.decode still accepts them; `_decode_session_token` is the matching fast verifier.
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": _JWT_ALGORITHM, "typ": "JWT"}))
+_JWT_HMAC = (
+    hmac.new(_JWT_KEY, digestmod=_HMAC_DIGESTS[_JWT_ALGORITHM])
+    if _JWT_ALGORITHM in _HMAC_DIGESTS else None
+)
+
+
+def _encode_session_token(payload: Dict[str, Any]) -> str:
+    """Sign a JSON-native payload (str/int values) as a compact JWT."""
+    if _JWT_HMAC is None:
+        return jwt.encode(payload, _JWT_KEY, algorithm=_JWT_ALGORITHM)
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+    mac = _JWT_HMAC.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _decode_session_token(token: str) -> Dict[str, Any]:
+    """Verify and decode a token signed by `_encode_session_token`.
+
+    Fast path for HMAC keys: the signature is recomputed from the prepared HMAC
+    state and compared in constant time, then `exp` is enforced as jwt.decode
+    would. Anything unusual (foreign header, nbf claim, non-integer exp) is
+    handed to jwt.decode so PyJWT's full validation and error types apply.
+    Raises the same jwt exceptions as jwt.decode.
+    """
+    if _JWT_HMAC is None:
+        return jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+    try:
+        signing_input, _, signature_b64 = token.encode("ascii").rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        signature = _b64url_decode(signature_b64)
+    except (UnicodeEncodeError, ValueError) as e:
+        raise jwt.DecodeError("Invalid token segments") from e
+    if header_b64 != _JWT_HEADER_B64 or not payload_b64:
+        return jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+
+    mac = _JWT_HMAC.copy()
+    mac.update(signing_input)
+    if not hmac.compare_digest(mac.digest(), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except (ValueError, orjson.JSONDecodeError) as e:
+        raise jwt.DecodeError("Invalid payload") from e
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+    if type(exp) is not int or "nbf" in payload:
+        return jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+    if exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+
+def _issue_tokens(emp_id: int, email: str) -> Tuple[str, str]:
+    """Sign an (access, refresh) token pair sharing one timestamp."""
+    now = int(time.time())
+    access = _encode_session_token(
+        {"sub": email, "emp_id": emp_id, "type": "access", "exp": now + _ACCESS_TOKEN_TTL_S, "iat": now}
+    )
+    refresh = _encode_session_token(
+        {"sub": email, "emp_id": emp_id, "type": "refresh", "exp": now + _REFRESH_TOKEN_TTL_S, "iat": now}
+    )
+    return access, refresh
+
+# Verified token claims (any token type), so re-presented tokens skip jwt.decode.
+# Only claims are cached: the employee is reloaded on every request so that
+# disabling or editing an account takes effect immediately.
+_decoded_token_cache = TTLCache(
+    maxsize=getattr(settings, "JWT_CACHE_MAXSIZE", None) or 10000,
+    ttl_seconds=getattr(settings, "JWT_CACHE_TTL_S", None) or 5,
+)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Cache key for a token; the raw token is never stored."""
+    return hashlib.sha256(token.encode()).digest()[:16]
 
 
 class AuthService:
@@ -42,6 +158,9 @@ class AuthService:
     
     def __init__(self):
         self.employee_service = EmployeeService()
+        # Bound once so callers avoid the auth_service.employee_service.* chain
+        self.get_employee_by_email = self.employee_service.get_employee_by_email
+        self.employee_repository = self.employee_service.repository
         self.logger = get_logger(__name__)
     
     @log_execution_time()
@@ -51,16 +170,23 @@ class AuthService:
         *,
         email: str,
         password: str
-    ) -> Employee:
-        """Authenticate user with email and password."""
+    ) -> Row:
+        """Authenticate user with email and password.
+
+        Returns the credentials row (emp_id, emp_email, emp_status, emp_password)
+        rather than a hydrated Employee: login only needs the id and email to
+        issue tokens.
+        """
         context = build_log_context()
         
         try:
             self.logger.info(f"{context}AUTH_ATTEMPT: User authentication started - Email: {sanitize_log_data(email)}")
             
-            employee = await self.employee_service.get_employee_by_email(db, email=email)
+            employee = await self.employee_repository.get_credentials_by_email(db, email)
             
             if not employee:
+                # Burn a real bcrypt verify so unknown emails take as long as known ones
+                await self.employee_service.verify_password(password, DUMMY_PASSWORD_HASH)
                 self.logger.warning(f"{context}AUTH_FAILED: Employee not found - Email: {sanitize_log_data(email)}")
                 raise UnauthorizedError(INVALID_EMAIL_OR_PASSWORD)
             
@@ -91,19 +217,15 @@ class AuthService:
     def create_access_token(
         self,
         *,
-        employee: Employee,
+        employee: Union[Employee, Row],
         expires_delta: Optional[timedelta] = None
     ) -> str:
         """Create JWT access token."""
         context = build_log_context(user_id=employee.emp_id)
         
         try:
-            if expires_delta:
-                expire = datetime.now(timezone.utc) + expires_delta
-            else:
-                expire = datetime.now(timezone.utc) + timedelta(
-                    minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-                )
+            now = int(time.time())
+            expire = now + (int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_TTL_S)
             
             self.logger.debug(f"{context}TOKEN_CREATE_ACCESS: Creating access token - Employee ID: {employee.emp_id}, Expires: {expire}")
             
@@ -112,10 +234,10 @@ class AuthService:
                 "emp_id": employee.emp_id,
                 "type": "access",
                 "exp": expire,
-                "iat": datetime.now(timezone.utc)
+                "iat": now
             }
             
-            token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+            token = _encode_session_token(payload)
             
             self.logger.info(f"{context}TOKEN_CREATE_ACCESS_SUCCESS: Access token created - Employee ID: {employee.emp_id}")
             return token
@@ -128,19 +250,15 @@ class AuthService:
     def create_refresh_token(
         self,
         *,
-        employee: Employee,
+        employee: Union[Employee, Row],
         expires_delta: Optional[timedelta] = None
     ) -> str:
         """Create JWT refresh token."""
         context = build_log_context(user_id=employee.emp_id)
         
         try:
-            if expires_delta:
-                expire = datetime.now(timezone.utc) + expires_delta
-            else:
-                expire = datetime.now(timezone.utc) + timedelta(
-                    days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-                )
+            now = int(time.time())
+            expire = now + (int(expires_delta.total_seconds()) if expires_delta else _REFRESH_TOKEN_TTL_S)
             
             self.logger.debug(f"{context}TOKEN_CREATE_REFRESH: Creating refresh token - Employee ID: {employee.emp_id}, Expires: {expire}")
             
@@ -149,10 +267,10 @@ class AuthService:
                 "emp_id": employee.emp_id,
                 "type": "refresh",
                 "exp": expire,
-                "iat": datetime.now(timezone.utc)
+                "iat": now
             }
             
-            token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+            token = _encode_session_token(payload)
             
             self.logger.info(f"{context}TOKEN_CREATE_REFRESH_SUCCESS: Refresh token created - Employee ID: {employee.emp_id}")
             return token
@@ -161,13 +279,31 @@ class AuthService:
             self.logger.error(f"{context}TOKEN_CREATE_REFRESH_ERROR: Failed to create refresh token - Employee ID: {employee.emp_id}, Error: {str(e)}")
             raise
     
+    def _make_tokens(self, employee: Union[Employee, Row]) -> Dict[str, str]:
+        """Issue a fresh access/refresh token pair (needs only emp_id and emp_email).
+
+        Login, refresh and Microsoft login all go through `_issue_tokens`, one
+        module-level fast path, instead of two decorated create_* calls.
+        """
+        access_token, refresh_token = _issue_tokens(employee.emp_id, employee.emp_email)
+        self.logger.debug(f"{build_log_context(user_id=employee.emp_id)}TOKEN_CREATE: Access and refresh tokens created - Employee ID: {employee.emp_id}")
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer"
+        }
+
     @log_execution_time()
     def verify_token(
         self,
         token: str,
         token_type: str = "access"
     ) -> Dict[str, Any]:
-        """Verify JWT token and return payload."""
+        """Verify JWT token and return payload.
+
+        Decoded claims are cached for a few seconds (never past `exp`); the
+        type and required-field checks below still run on every call.
+        """
         context = build_log_context()
         
         try:
@@ -175,11 +311,12 @@ class AuthService:
             token_preview = f"{token[:10]}...{token[-4:]}" if len(token) > 14 else "***"
             self.logger.debug(f"{context}TOKEN_VERIFY: Verifying {token_type} token - {token_preview}")
             
-            payload = jwt.decode(
-                token, 
-                settings.SECRET_KEY, 
-                algorithms=[settings.ALGORITHM]
-            )
+            cache_key = _token_cache_key(token)
+            cached = _decoded_token_cache.get(cache_key)
+            if cached is not None:
+                payload = cached
+            else:
+                payload = _decode_session_token(token)
             
             # Verify token type
             if payload.get("type") != token_type:
@@ -191,6 +328,8 @@ class AuthService:
                 self.logger.warning(f"{context}TOKEN_VERIFY_FAILED: Missing required fields - sub: {bool(payload.get('sub'))}, emp_id: {bool(payload.get('emp_id'))}")
                 raise UnauthorizedError(INVALID_REFRESH_TOKEN if token_type == "refresh" else INVALID_ACCESS_TOKEN)
             
+            if cached is None:
+                _decoded_token_cache.put(cache_key, payload, expires_at=payload.get("exp"))
             self.logger.debug(f"{context}TOKEN_VERIFY_SUCCESS: {token_type} token verified - Employee ID: {payload.get('emp_id')}")
             return payload
             
@@ -217,17 +356,13 @@ class AuthService:
         If `db` is provided the token jti and expiry will be stored so the token can be
         invalidated after use.
         """
-        import uuid
-
         context = build_log_context(user_id=employee.emp_id)
 
         try:
             if expires_delta:
                 expire = datetime.now(timezone.utc) + expires_delta
             else:
-                expire = datetime.now(timezone.utc) + timedelta(
-                    minutes=settings.PASSWORD_RESET_EXPIRE_MINUTES
-                )
+                expire = datetime.now(timezone.utc) + _PASSWORD_RESET_TTL
 
             jti = str(uuid.uuid4())
 
@@ -240,20 +375,23 @@ class AuthService:
                 "iat": datetime.now(timezone.utc)
             }
 
-            token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+            token = jwt.encode(payload, _JWT_KEY, algorithm=_JWT_ALGORITHM)
 
-            # Persist token jti if DB provided so we can enforce single-use
+            # Persist token jti if DB provided so we can enforce single-use.
+            # A single Core INSERT is sent immediately (no unit-of-work flush);
+            # the request's session boundary commits it with the rest of the request.
             if db is not None:
-                prt = PasswordResetToken(
-                    emp_id=employee.emp_id,
-                    jti=jti,
-                    used=False,
-                    created_at=datetime.utcnow(),
-                    expires_at=expire.replace(tzinfo=None)
-                )
-                db.add(prt)
                 try:
-                    await db.flush()
+                    await db.execute(
+                        insert(PasswordResetToken)
+                        .values(
+                            emp_id=employee.emp_id,
+                            jti=jti,
+                            used=False,
+                            created_at=datetime.utcnow(),
+                            expires_at=expire.replace(tzinfo=None)
+                        )
+                    )
                 except Exception:
                     # Do not fail whole flow if DB write fails — log and continue
                     self.logger.exception(f"{context}TOKEN_PERSIST_WARN: Failed to persist password reset token jti")
@@ -274,7 +412,7 @@ class AuthService:
         context = build_log_context()
 
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
 
             if payload.get("type") != "password_reset":
                 self.logger.warning(f"{context}TOKEN_VERIFY_FAILED: Invalid token type for password reset - Got: {payload.get('type')}")
@@ -354,7 +492,13 @@ class AuthService:
         *,
         token: str
     ) -> Employee:
-        """Get current user from access token."""
+        """Get current user from access token.
+
+        The token's verified claims are cached by `verify_token`, but the
+        employee is loaded into the request session every time, so account
+        changes (disable, edits, password reset) apply to existing tokens
+        immediately.
+        """
         context = build_log_context()
         
         try:
@@ -385,6 +529,22 @@ class AuthService:
         except Exception as e:
             self.logger.error(f"{context}GET_CURRENT_USER_ERROR: Unexpected error retrieving current user - Error: {str(e)}")
             raise UnauthorizedError("Failed to retrieve current user")
+
+    async def get_current_user_id_from_token(self, db: AsyncSession, token: str) -> int:
+        """
+        Get the current user's ID from an access token without loading the employee.
+
+        The token is checked through the verified-claims cache; the account
+        must still exist and be active, which is checked against the
+        (emp_id, emp_status) projection instead of the full row.
+        """
+        context = build_log_context()
+
+        emp_id = int(self.verify_token(token, "access")["emp_id"])
+        if not await self.employee_service.is_active(db, emp_id):
+            self.logger.warning(f"{context}GET_CURRENT_USER_ID_FAILED: Account missing or disabled - Employee ID: {emp_id}")
+            raise UnauthorizedError(ACCOUNT_DISABLED)
+        return emp_id
     
     @log_execution_time()
     async def refresh_access_token(
@@ -418,16 +578,11 @@ class AuthService:
             
             # Create new tokens
             self.logger.debug(f"{context}TOKEN_REFRESH: Creating new tokens - Employee ID: {employee.emp_id}")
-            new_access_token = self.create_access_token(employee=employee)
-            new_refresh_token = self.create_refresh_token(employee=employee)
+            tokens = self._make_tokens(employee)
             
             self.logger.info(f"{context}TOKEN_REFRESH_SUCCESS: Tokens refreshed successfully - Employee ID: {employee.emp_id}")
             
-            return {
-                "access_token": new_access_token,
-                "refresh_token": new_refresh_token,
-                "token_type": "bearer"
-            }
+            return tokens
             
         except (UnauthorizedError, EntityNotFoundError):
             # Re-raise auth/entity errors as-is (already logged)
@@ -454,16 +609,11 @@ class AuthService:
             
             self.logger.debug(f"{context}LOGIN_AUTH_SUCCESS: User authenticated, creating tokens - Employee ID: {employee.emp_id}")
             
-            access_token = self.create_access_token(employee=employee)
-            refresh_token = self.create_refresh_token(employee=employee)
+            tokens = self._make_tokens(employee)
             
             self.logger.info(f"{context}LOGIN_SUCCESS: Login completed successfully - Employee ID: {employee.emp_id}, Email: {sanitize_log_data(email)}")
             
-            return {
-                "access_token": access_token,
-                "refresh_token": refresh_token,
-                "token_type": "bearer"
-            }
+            return tokens
             
         except (UnauthorizedError, EntityNotFoundError):
             # Re-raise auth/entity errors as-is (already logged)
@@ -526,8 +676,6 @@ class AuthService:
                 full_name = id_token_claims.get("name", email.split("@")[0])
 
                 # Create employee directly using the model
-                from app.models.employee import Employee
-
                 employee = Employee(
                     emp_name=full_name,
                     emp_email=email,
@@ -597,16 +745,11 @@ class AuthService:
             self.logger.debug(f"{context}MS_LOGIN_AUTH_SUCCESS: User authenticated, creating tokens - Employee ID: {employee.emp_id}")
 
             # Create JWT tokens
-            access_token = self.create_access_token(employee=employee)
-            refresh_token = self.create_refresh_token(employee=employee)
+            tokens = self._make_tokens(employee)
 
             self.logger.info(f"{context}MS_LOGIN_SUCCESS: Microsoft login completed successfully - Employee ID: {employee.emp_id}, Email: {sanitize_log_data(email)}")
 
-            return {
-                "access_token": access_token,
-                "refresh_token": refresh_token,
-                "token_type": "bearer"
-            }
+            return tokens
 
         except (UnauthorizedError, EntityNotFoundError):
             # Re-raise auth/entity errors as-is (already logged)
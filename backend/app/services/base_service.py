@@ -6,7 +6,7 @@ while delegating database operations to repositories.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, TypeVar, Generic
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
@@ -50,7 +50,58 @@ class BaseService(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def id_field(self) -> str:
         """Return the name of the primary key field."""
         pass
+
+    async def stream_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        load_options: Optional[List[Any]] = None
+    ) -> AsyncIterator[ModelType]:
+        """
+        Yield entities as they are fetched, for pages too large to buffer.
+
+        Delegates to the subclass repository's `stream_multi`; `load_options`
+        are passed to the query as loader options.
+        """
+        context = build_log_context()
+
+        self.logger.info(f"{context}SERVICE_REQUEST: Stream {self.entity_name}s - skip: {skip}, limit: {limit}")
+
+        async for entity in self.repository.stream_multi(db, skip=skip, limit=limit, options=load_options):
+            yield entity
     
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        entity_id: int,
+        obj_in: UpdateSchemaType
+    ) -> ModelType:
+        """
+        Update an entity by ID in one UPDATE ... RETURNING round-trip.
+
+        The entity is not loaded first, so only `validate_business_rules` runs;
+        the before/after update hooks, which take the loaded entity, are
+        skipped. Use a get-then-update flow when those hooks matter.
+
+        Raises:
+            EntityNotFoundError: If no entity has this ID
+        """
+        context = build_log_context()
+
+        self.logger.info(f"{context}SERVICE_REQUEST: Update {self.entity_name} by ID: {entity_id}")
+
+        update_data = obj_in.model_dump(exclude_unset=True)
+        await self.validate_business_rules(db, update_data, exclude_id=entity_id)
+
+        updated = await self.repository.update_by_id(db, entity_id, update_data)
+        if updated is None:
+            self.logger.warning(f"{context}SERVICE_NOT_FOUND: {self.entity_name} with ID {entity_id} not found")
+            raise EntityNotFoundError(f"{self.entity_name} with ID {entity_id} not found")
+
+        return updated
+
     async def get_by_id_or_404(
         self,
         db: AsyncSession,
@@ -308,6 +359,32 @@ class BaseService(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             self.logger.error(f"{context}UNEXPECTED_DELETE_ERROR: Failed to delete {self.entity_name} with ID {entity_id} - {str(e)}")
             raise BaseServiceException(f"Unexpected error deleting {self.entity_name}")
 
+    async def delete_by_ids(
+        self,
+        db: AsyncSession,
+        *,
+        entity_ids: List[int]
+    ) -> int:
+        """
+        Delete several entities by ID in one statement and return how many were removed.
+
+        Unlike `delete`, the entities are not loaded, so the before/after
+        delete hooks do not run and missing IDs are skipped rather than
+        raising.
+        """
+        context = build_log_context()
+
+        self.logger.info(f"{context}SERVICE_DELETE_REQUEST: Bulk deleting {len(entity_ids)} {self.entity_name} records")
+
+        try:
+            deleted = await self.repository.delete_by_ids(db, entity_ids)
+            self.logger.info(f"{context}SERVICE_DELETE_SUCCESS: Deleted {deleted} of {len(entity_ids)} {self.entity_name} records")
+            return deleted
+
+        except BaseRepositoryException as e:
+            self.logger.error(f"{context}REPOSITORY_DELETE_ERROR: {e.__class__.__name__} - {e.message}")
+            raise BaseServiceException(f"Failed to delete {self.entity_name} records: {e.message}")
+
     async def soft_delete(
         self,
         db: AsyncSession,
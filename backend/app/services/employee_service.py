@@ -5,12 +5,17 @@ This module provides business logic for employee-related operations
 with proper validation and error handling.
 """
 
-from typing import List, Optional, Dict, Any, Union
+import asyncio
+from typing import AsyncIterator, List, Optional, Dict, Any, Union
+
+import bcrypt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import or_
-from passlib.context import CryptContext
+from sqlalchemy import and_, or_
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.config import settings
 from app.models.employee import Employee
+from app.models.role import Role
 from app.schemas.employee import EmployeeCreate, EmployeeUpdate
 from app.services.base_service import BaseService
 from app.repositories.employee_repository import EmployeeRepository
@@ -33,8 +38,38 @@ from app.utils.logger import (
     get_logger, log_execution_time, log_exception, 
     log_business_operation, build_log_context, sanitize_log_data
 )
+from app.utils.ttl_cache import TTLCache
+
+# bcrypt cost is a CPU/brute-force tradeoff: each +1 round doubles hashing time.
+# 10 is the OWASP baseline (~4x cheaper than the previous default of 12); existing
+# hashes keep verifying at whatever cost they were created with.
+BCRYPT_ROUNDS = getattr(settings, "BCRYPT_ROUNDS", None) or 10
+
+
+def _hash_password(plain_password: str) -> str:
+    """Hash a password with the native bcrypt binding ($2b$, BCRYPT_ROUNDS)."""
+    return bcrypt.hashpw(plain_password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a stored bcrypt hash ($2a$/$2b$/$2y$)."""
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+# Verified against when a login email does not exist, so unknown accounts cost
+# the same bcrypt work as real ones and response time doesn't reveal them
+DUMMY_PASSWORD_HASH = _hash_password("timing-equalization-dummy")
+
+
+# emp_ids whose (emp_id, emp_status) projection last read as active. Only
+# active results are cached, so re-enabling an account applies immediately;
+# update/soft-delete drop the entry, and the short TTL bounds how long another
+# worker process (or a read racing the write's commit) can still see a
+# just-disabled account as active.
+_active_employee_cache = TTLCache(
+    maxsize=getattr(settings, "ACTIVE_EMPLOYEE_CACHE_MAXSIZE", None) or 10000,
+    ttl_seconds=getattr(settings, "ACTIVE_EMPLOYEE_CACHE_TTL_S", None) or 10,
+)
 
 
 class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
@@ -85,6 +120,8 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
             
             # Use repository to update
             updated_employee = await self.repository.update(db, db_obj)
+            # emp_status may have changed
+            _active_employee_cache.discard(employee_id)
             
             self.logger.info(f"{context}SERVICE_SUCCESS: Updated {self.entity_name} - ID: {employee_id}")
             return updated_employee
@@ -166,6 +203,39 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
             self.logger.error(f"{context}UNEXPECTED_ERROR: Failed to get {self.entity_name} by ID {entity_id} - {str(e)}")
             return None
     
+    async def after_delete(self, db: AsyncSession, deleted_obj: Employee) -> None:
+        """Forget the cached active status of a (soft-)deleted employee."""
+        _active_employee_cache.discard(deleted_obj.emp_id)
+
+    async def is_active(self, db: AsyncSession, emp_id: int) -> bool:
+        """
+        Return whether the employee exists and is active.
+
+        Reads only the (emp_id, emp_status) projection, and serves recently
+        confirmed active employees from an in-process cache.
+        """
+        if _active_employee_cache.get(emp_id):
+            return True
+
+        row = await self.repository.get_status_by_id(db, emp_id)
+        if row is None or not row.emp_status:
+            return False
+
+        _active_employee_cache.put(emp_id, True)
+        return True
+
+    async def _attach_role(self, db: AsyncSession, employee: Employee) -> Employee:
+        """
+        Populate `employee.role` within the current transaction.
+
+        Routers serialize `role` straight after a write; loading it here (a PK
+        lookup that is served from the identity map when the role is already
+        in the session) avoids re-fetching the whole employee afterwards.
+        """
+        role = await db.get(Role, employee.role_id)
+        set_committed_value(employee, "role", role)
+        return employee
+
     @log_execution_time()
     @log_exception()
     async def create_employee(
@@ -180,26 +250,32 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
         self.logger.info(f"{context}SERVICE_REQUEST: Create {self.entity_name} - Email: {sanitize_log_data(employee_data.emp_email)}")
         
         try:
-            # Validate email uniqueness
-            await self._validate_email_unique(db, employee_data.emp_email)
-            
             # Validate reporting manager if provided
             if employee_data.emp_reporting_manager_id and employee_data.emp_reporting_manager_id != 0:
                 await self._validate_reporting_manager(db, employee_data.emp_reporting_manager_id)
             else:
                 employee_data.emp_reporting_manager_id = None
             
+            # Reject known duplicates with a one-column lookup before paying
+            # for the bcrypt hash below
+            await self._validate_email_unique(db, employee_data.emp_email)
+            
             # Hash password
             obj_data = employee_data.model_dump()
             plain_password = obj_data.pop("password")
-            hashed_password = pwd_context.hash(plain_password)
+            # bcrypt is CPU-bound; hash off the event loop so other requests keep flowing
+            hashed_password = await asyncio.to_thread(_hash_password, plain_password)
             obj_data["emp_password"] = hashed_password
             
             self.logger.debug(f"{context}PASSWORD_HASHED: Password securely hashed for {self.entity_name}")
             
-            # Create employee using repository
-            db_employee = Employee(**obj_data)
-            created_employee = await self.repository.create(db, db_employee)
+            # Insert unless the email is taken; ON CONFLICT still guards the
+            # race with a concurrent create of the same email
+            created_employee = await self.repository.create_if_email_available(db, obj_data)
+            if created_employee is None:
+                self.logger.warning(f"{context}VALIDATION_FAILED: Email already exists - {sanitize_log_data(employee_data.emp_email)}")
+                raise DuplicateEntityError(ENTITY_EMPLOYEE, "email")
+            await self._attach_role(db, created_employee)
             
             self.logger.info(f"{context}SERVICE_SUCCESS: Created {self.entity_name} with ID: {getattr(created_employee, self.id_field)}")
             return created_employee
@@ -256,6 +332,7 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
             
             # Update employee
             updated_employee = await self.update(db=db, db_obj=db_employee, obj_in=employee_data)
+            await self._attach_role(db, updated_employee)
             
             self.logger.info(f"{context}SERVICE_SUCCESS: Updated {self.entity_name} with ID: {employee_id}")
             return updated_employee
@@ -277,6 +354,47 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
             self.logger.error(f"{context}UNEXPECTED_ERROR: Failed to update {self.entity_name} ID {employee_id} - {str(e)}")
             raise BaseServiceException(f"Unexpected error updating {self.entity_name}")
     
+    def _build_employee_filters(
+        self,
+        db: AsyncSession,
+        *,
+        search: Optional[str] = None,
+        status: Optional[bool] = None,
+        department: Optional[str] = None,
+        role: Optional[str] = None
+    ) -> List:
+        """Build the WHERE clauses shared by the list and streaming queries."""
+        context = build_log_context()
+        filters = []
+        
+        if status is not None:
+            filters.append(Employee.emp_status == status)
+            self.logger.debug(f"{context}FILTER_APPLIED: Status filter - {status}")
+        
+        if department:
+            filters.append(Employee.emp_department.ilike(f"%{department}%"))
+            self.logger.debug(f"{context}FILTER_APPLIED: Department filter - {sanitize_log_data(department)}")
+        
+        if role:
+            # Join with Role table to filter by role name
+            filters.append(
+                Employee.role_id.in_(
+                    db.query(Role.id).filter(Role.role_name.ilike(f"%{role}%"))
+                )
+            )
+            self.logger.debug(f"{context}FILTER_APPLIED: Role filter - {sanitize_log_data(role)}")
+
+        # Add search filters
+        if search:
+            search_filters = self._build_search_filters(
+                search,
+                ["emp_name", "emp_email", "emp_department"]
+            )
+            filters.extend(search_filters)
+            self.logger.debug(f"{context}SEARCH_APPLIED: Search term - {sanitize_log_data(search)}")
+        
+        return filters
+
     @log_execution_time()
     @log_exception()
     async def get_employees_with_filters(
@@ -296,35 +414,9 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
         self.logger.info(f"{context}SERVICE_REQUEST: Get {self.entity_name}s with filters - skip: {skip}, limit: {limit}, search: {sanitize_log_data(search)}")
         
         try:
-            filters = []
-            
-            if status is not None:
-                filters.append(Employee.emp_status == status)
-                self.logger.debug(f"{context}FILTER_APPLIED: Status filter - {status}")
-            
-            if department:
-                filters.append(Employee.emp_department.ilike(f"%{department}%"))
-                self.logger.debug(f"{context}FILTER_APPLIED: Department filter - {sanitize_log_data(department)}")
-            
-            if role:
-                # Join with Role table to filter by role name
-                from app.models.role import Role
-                from sqlalchemy import and_
-                filters.append(
-                    Employee.role_id.in_(
-                        db.query(Role.id).filter(Role.role_name.ilike(f"%{role}%"))
-                    )
-                )
-                self.logger.debug(f"{context}FILTER_APPLIED: Role filter - {sanitize_log_data(role)}")
-
-            # Add search filters
-            if search:
-                search_filters = self._build_search_filters(
-                    search,
-                    ["emp_name", "emp_email", "emp_department"]
-                )
-                filters.extend(search_filters)
-                self.logger.debug(f"{context}SEARCH_APPLIED: Search term - {sanitize_log_data(search)}")
+            filters = self._build_employee_filters(
+                db, search=search, status=status, department=department, role=role
+            )
             
             employees = await self.repository.get_multi(
                 db=db,
@@ -344,6 +436,39 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
         except Exception as e:
             self.logger.error(f"{context}UNEXPECTED_ERROR: Failed to get {self.entity_name}s with filters - {str(e)}")
             raise BaseServiceException(f"Unexpected error retrieving {self.entity_name}s")
+
+    async def stream_employees_with_filters(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        status: Optional[bool] = None,
+        department: Optional[str] = None,
+        role: Optional[str] = None
+    ) -> AsyncIterator[Employee]:
+        """
+        Yield filtered employees as they are fetched, for large pages.
+
+        Same filters and ordering as `get_employees_with_filters`, but rows are
+        never collected into a list, so memory stays flat in the page size.
+        """
+        context = build_log_context()
+        
+        self.logger.info(f"{context}SERVICE_REQUEST: Stream {self.entity_name}s with filters - skip: {skip}, limit: {limit}, search: {sanitize_log_data(search)}")
+        
+        filters = self._build_employee_filters(
+            db, search=search, status=status, department=department, role=role
+        )
+        async for employee in self.repository.stream_multi(
+            db,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            order_by=Employee.emp_name
+        ):
+            yield employee
     
     @log_execution_time()
     @log_exception()
@@ -394,7 +519,7 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
             employee = await self.get_by_id_or_404(
                 db,
                 employee_id,
-                load_relationships=["subordinates"]
+                load_relationships=["role", "subordinates"]
             )
             
             subordinate_count = len(employee.subordinates) if hasattr(employee, 'subordinates') and employee.subordinates else 0
@@ -426,7 +551,8 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
         self.logger.debug(f"{context}SERVICE_REQUEST: Verify password hash")
         
         try:
-            is_valid = pwd_context.verify(plain_password, hashed_password)
+            # bcrypt is CPU-bound (and releases the GIL), so verify in a worker thread
+            is_valid = await asyncio.to_thread(_check_password, plain_password, hashed_password)
             
             if is_valid:
                 self.logger.debug(f"{context}PASSWORD_VERIFICATION: Password verification successful")
@@ -592,7 +718,7 @@ class EmployeeService(BaseService[Employee, EmployeeCreate, EmployeeUpdate]):
 
             employee = await self.get_by_id_or_404(db, employee_id)
 
-            hashed = pwd_context.hash(new_password)
+            hashed = await asyncio.to_thread(_hash_password, new_password)
             employee.emp_password = hashed
 
             updated = await self.repository.update(db, employee)
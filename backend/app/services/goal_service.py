@@ -18,6 +18,7 @@ from app.schemas.goal import (
 from app.services.base_service import BaseService
 from app.repositories.category_repository import CategoryRepository
 from app.repositories.goal_repository import GoalRepository
+from app.repositories.goal_template_repository import GoalTemplateRepository
 from app.repositories.appraisal_goal_repository import AppraisalGoalRepository
 from app.exceptions import EntityNotFoundError, ValidationError
 from app.exceptions.domain_exceptions import (
@@ -191,9 +192,10 @@ class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
         skip: int = 0,
         limit: int = 100,
         filters: Optional[List] = None,
-        order_by = None
+        order_by = None,
+        load_options: Optional[List] = None
     ) -> List[Goal]:
-        """Get multiple goals."""
+        """Get multiple goals; `load_options` are passed to the query as loader options."""
         self.logger.info(f"Fetching multiple goals - skip: {skip}, limit: {limit}")
         
         try:
@@ -202,7 +204,8 @@ class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
                 skip=skip,
                 limit=limit,
                 filters=filters,
-                order_by=order_by
+                order_by=order_by,
+                options=load_options
             )
             
             self.logger.info(f"Successfully retrieved {len(goals)} goals")
@@ -256,12 +259,40 @@ class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
             raise
 
 
+    @log_execution_time()
+    @log_exception()
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        entity_id: int,
+        obj_in: GoalUpdate
+    ) -> Goal:
+        """Update a goal's columns in one UPDATE ... RETURNING, then its categories if given."""
+        self.logger.info(f"Updating goal with ID: {entity_id}")
+
+        update_data = obj_in.model_dump(exclude_unset=True)
+        category_ids = update_data.pop("category_ids", None)
+        self.logger.debug(f"Update data: {sanitize_log_data(update_data)}")
+
+        await self.validate_business_rules(db, update_data, exclude_id=entity_id)
+
+        updated_goal = await self.repository.update_by_id(db, entity_id, update_data)
+        if updated_goal is None:
+            self.logger.warning(f"Goal with ID {entity_id} not found")
+            raise EntityNotFoundError(f"{self.entity_name} with ID {entity_id} not found")
+
+        if category_ids is not None:
+            await self.repository.update_categories(db, updated_goal, category_ids=category_ids)
+
+        self.logger.info(f"Successfully updated goal with ID: {entity_id}")
+        return updated_goal
+
+
 class GoalTemplateService(BaseService[GoalTemplate, GoalTemplateCreate, GoalTemplateUpdate]):
     """Service class for goal template operations."""
     
     def __init__(self):
         super().__init__(GoalTemplate)
-        from app.repositories.goal_template_repository import GoalTemplateRepository
         self.repository = GoalTemplateRepository()
         self.logger = get_logger(f"app.services.{self.__class__.__name__}")
         self.logger.debug("GoalTemplateService initialized successfully")
@@ -396,17 +427,15 @@ class GoalTemplateService(BaseService[GoalTemplate, GoalTemplateCreate, GoalTemp
             
             # Create new goal template using repository
             template_dict = template_data.model_dump(exclude={"categories"})
+            # Returned with its categories already attached; no reload needed
             db_template = await self.repository.create_with_categories(
                 db,
                 template_data=template_dict,
                 categories=categories
             )
             
-            # Reload with categories for response
-            result = await self.get_template_with_categories(db, db_template.temp_id)
-            
             self.logger.info(f"{context}SERVICE_SUCCESS: Created {self.entity_name} with categories - ID: {db_template.temp_id}")
-            return result
+            return db_template
             
         except BaseRepositoryException as e:
             self.logger.error(f"{context}REPOSITORY_ERROR: Failed to create {self.entity_name} with categories - {e.message}")
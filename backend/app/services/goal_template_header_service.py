@@ -15,10 +15,14 @@ from app.schemas.goal import (
     GoalTemplateHeaderUpdate,
     GoalTemplateHeaderResponse,
     GoalTemplateHeaderWithTemplates,
-    GoalTemplateTypeEnum
+    GoalTemplateHeaderFilter,
+    GoalTemplateTypeEnum,
+    GoalTemplateCreate
 )
 from app.services.base_service import BaseService
 from app.repositories.goal_template_header_repository import GoalTemplateHeaderRepository
+from app.repositories.application_role_repository import ApplicationRoleRepository
+from app.services.goal_service import GoalTemplateService
 from app.exceptions.domain_exceptions import (
     EntityNotFoundError as DomainEntityNotFoundError,
     ValidationError as DomainValidationError,
@@ -111,7 +115,6 @@ class GoalTemplateHeaderService(BaseService[GoalTemplateHeader, GoalTemplateHead
         try:
             # Validate application_role_id exists (if provided)
             if obj_in.application_role_id:
-                from app.repositories.application_role_repository import ApplicationRoleRepository
                 app_role_repo = ApplicationRoleRepository()
                 app_role = await app_role_repo.get_by_id(db, obj_in.application_role_id)
 
@@ -282,10 +285,8 @@ class GoalTemplateHeaderService(BaseService[GoalTemplateHeader, GoalTemplateHead
             # current user who is deleting), then delete the original header.
             try:
                 # header.goal_template_type is a model enum (GoalTemplateType)
-                from app.models.goal import GoalTemplateType as _ModelGoalTemplateType
-
                 if (
-                    getattr(header, 'goal_template_type', None) == _ModelGoalTemplateType.SELF
+                    getattr(header, 'goal_template_type', None) == GoalTemplateType.SELF
                     and getattr(header, 'shared_users_id', None)
                 ):
                     # If the owner is deleting a Self header that was shared to others,
@@ -328,133 +329,24 @@ class GoalTemplateHeaderService(BaseService[GoalTemplateHeader, GoalTemplateHead
             raise
 
     @log_execution_time()
-    async def get_all_with_templates(
-        self,
-        db: AsyncSession,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all headers with their templates."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}SERVICE_GET_ALL_WITH_TEMPLATES: Getting all headers - Skip: {skip}, Limit: {limit}")
-
-        try:
-            headers = await self.repository.get_all_with_templates(db, skip, limit, search)
-
-            self.logger.info(f"{context}SERVICE_GET_ALL_WITH_TEMPLATES_SUCCESS: Retrieved {len(headers)} headers")
-            return headers
-
-        except Exception as e:
-            self.logger.error(f"{context}SERVICE_GET_ALL_WITH_TEMPLATES_ERROR: Failed to get headers, Error: {str(e)}")
-            raise
-
-    @log_execution_time()
-    async def get_by_type(
-        self,
-        db: AsyncSession,
-        goal_template_type: GoalTemplateTypeEnum,
-        include_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all headers of a specific type."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}SERVICE_GET_BY_TYPE: Getting headers by type - Type: {goal_template_type}, Include Templates: {include_templates}")
-
-        try:
-            # Convert schema enum to model enum
-            model_type = GoalTemplateType.ORGANIZATION if goal_template_type == GoalTemplateTypeEnum.ORGANIZATION else GoalTemplateType.SELF
-            headers = await self.repository.get_by_type(db, model_type, include_templates, skip, limit, search)
-
-            self.logger.info(f"{context}SERVICE_GET_BY_TYPE_SUCCESS: Retrieved {len(headers)} headers of type {goal_template_type}")
-            return headers
-
-        except Exception as e:
-            self.logger.error(f"{context}SERVICE_GET_BY_TYPE_ERROR: Failed to get headers by type {goal_template_type}, Error: {str(e)}")
-            raise
-
-    @log_execution_time()
-    async def get_by_application_role_id(
+    async def list_headers(
         self,
         db: AsyncSession,
-        application_role_id: int,
-        include_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
+        filters: GoalTemplateHeaderFilter
     ) -> List[GoalTemplateHeader]:
-        """Get all template headers for an application role."""
+        """Get headers with their templates, narrowed by every set field of `filters`."""
         context = build_log_context()
 
-        self.logger.debug(f"{context}SERVICE_GET_BY_APP_ROLE_ID: Getting headers - App Role ID: {application_role_id}")
+        self.logger.debug(f"{context}SERVICE_LIST_HEADERS: Listing headers - Filters: {filters}")
 
         try:
-            headers = await self.repository.get_by_application_role(
-                db, application_role_id, include_templates, skip, limit, search
-            )
+            headers = await self.repository.list_headers(db, filters)
 
-            self.logger.info(f"{context}SERVICE_GET_BY_APP_ROLE_ID_SUCCESS: Retrieved {len(headers)} headers")
+            self.logger.info(f"{context}SERVICE_LIST_HEADERS_SUCCESS: Retrieved {len(headers)} headers")
             return headers
 
         except Exception as e:
-            self.logger.error(f"{context}SERVICE_GET_BY_APP_ROLE_ID_ERROR: Failed to get headers, Error: {str(e)}")
-            raise
-
-    @log_execution_time()
-    async def get_self_headers_for_user(
-        self,
-        db: AsyncSession,
-        user_id: int,
-        user_role_id: int,
-        include_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all Self type headers created by a specific user (all roles they've created)."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}SERVICE_GET_SELF_HEADERS_FOR_USER: Getting self headers for user - User ID: {user_id}, Include Templates: {include_templates}")
-
-        try:
-            # Don't filter by role - users should see all self templates they created regardless of role
-            headers = await self.repository.get_by_creator(db, user_id, None, include_templates, skip, limit, search)
-
-            self.logger.info(f"{context}SERVICE_GET_SELF_HEADERS_FOR_USER_SUCCESS: Retrieved {len(headers)} self headers for user {user_id}")
-            return headers
-
-        except Exception as e:
-            self.logger.error(f"{context}SERVICE_GET_SELF_HEADERS_FOR_USER_ERROR: Failed to get self headers for user {user_id}, Error: {str(e)}")
-            raise
-
-    @log_execution_time()
-    async def get_shared_with_user(
-        self,
-        db: AsyncSession,
-        user_id: int,
-        user_role_id: int,
-        include_templates: bool = False,
-        skip: int = 0,
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[GoalTemplateHeader]:
-        """Get all headers shared with a specific user (regardless of role). Note: user_role_id kept for compatibility but not used in filtering."""
-        context = build_log_context()
-
-        self.logger.debug(f"{context}SERVICE_GET_SHARED_WITH_USER: Getting shared headers for user - User ID: {user_id}, Include Templates: {include_templates}")
-
-        try:
-            headers = await self.repository.get_shared_with_user(db, user_id, user_role_id, include_templates, skip, limit, search)
-
-            self.logger.info(f"{context}SERVICE_GET_SHARED_WITH_USER_SUCCESS: Retrieved {len(headers)} shared headers for user {user_id}")
-            return headers
-
-        except Exception as e:
-            self.logger.error(f"{context}SERVICE_GET_SHARED_WITH_USER_ERROR: Failed to get shared headers for user {user_id}, Error: {str(e)}")
+            self.logger.error(f"{context}SERVICE_LIST_HEADERS_ERROR: Failed to list headers, Error: {str(e)}")
             raise
 
     @log_execution_time()
@@ -556,9 +448,6 @@ class GoalTemplateHeaderService(BaseService[GoalTemplateHeader, GoalTemplateHead
             raise BusinessRuleViolationError("Failed to clone header after 100 attempts. Too many existing copies.")
 
         # Clone templates
-        from app.services.goal_service import GoalTemplateService
-        from app.schemas.goal import GoalTemplateCreate
-        
         template_service = GoalTemplateService()
         
         for tpl_data in source_data['templates']:
@@ -0,0 +1,45 @@
+"""Rendered-response caches for the goal template catalog.
+
+Headers, templates and categories are read far more often than they are
+written, so their list endpoints cache the rendered JSON. The three are
+coupled: header lists embed their templates, template lists embed their
+categories, and deleting or cloning a header removes or adds templates. Every
+catalog write therefore calls the single `invalidate_catalog_caches()` below
+rather than clearing only the cache it thinks it touched.
+
+The caches are per-process (see TTLCache); the TTLs bound how long other
+worker processes can serve a stale list.
+"""
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.utils.ttl_cache import TTLCache
+
+
+# Header list reads (GET /goal-template-headers/...), keyed by their query parameters
+headers_cache = TTLCache(
+    maxsize=getattr(settings, "HEADERS_CACHE_MAXSIZE", None) or 1024,
+    ttl_seconds=getattr(settings, "HEADERS_CACHE_TTL_S", None) or 30,
+)
+
+# Category and template list reads (GET /goals/categories, /goals/templates),
+# keyed by endpoint and page
+catalog_cache = TTLCache(
+    maxsize=getattr(settings, "CATALOG_CACHE_MAXSIZE", None) or 256,
+    ttl_seconds=getattr(settings, "CATALOG_CACHE_TTL_S", None) or 60,
+)
+
+
+def invalidate_catalog_caches() -> None:
+    """Drop every cached header, template and category list.
+
+    Call only after the write has committed; otherwise a concurrent read can
+    cache the old rows again for the full TTL.
+    """
+    headers_cache.clear()
+    catalog_cache.clear()
+
+
+def cached_json_response(body: bytes) -> Response:
+    """Wrap an already-rendered JSON body taken from one of the caches."""
+    return Response(content=body, media_type="application/json")
@@ -6,6 +6,7 @@ across the application, including execution time tracking and exception logging.
 """
 
 import logging
+import os
 import time
 import traceback
 import uuid
@@ -36,12 +37,19 @@ def get_database_logger() -> logging.Logger:
 def log_execution_time(logger: Optional[logging.Logger] = None, include_args: bool = False):
     """
     Decorator to log function execution time with enhanced context.
+
+    Timing is opt-in via LOG_EXECUTION_TIME (true/1/yes), read when the function
+    is decorated: when it is off the function is returned unwrapped, so decorated
+    handlers, services and repositories pay nothing per call.
     
     Args:
         logger: Optional logger instance. If not provided, will create one.
         include_args: Whether to include function arguments in logs
     """
     def decorator(func: Callable) -> Callable:
+        if os.getenv("LOG_EXECUTION_TIME", "false").lower() not in ("true", "1", "yes"):
+            return func
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             log = logger or get_logger(func.__module__)
@@ -401,6 +409,25 @@ def log_business_operation(operation: str, entity_type: str, entity_id: Any = No
     log.info(f"{context}BUSINESS_OPERATION: {operation} {entity_info}")
 
 
+class SanitizeArgsFilter(logging.Filter):
+    """
+    Apply `sanitize_log_data` to a record's %-style arguments on demand.
+
+    Callers opt in with ``extra={"sanitize": True}``. Because filters only run
+    for records that passed the logger's level check, sanitisation is skipped
+    entirely when the message would be dropped anyway.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sanitize", False) and record.args:
+            if isinstance(record.args, dict):
+                record.args = {k: sanitize_log_data(v) for k, v in record.args.items()}
+            else:
+                record.args = tuple(sanitize_log_data(arg) for arg in record.args)
+            record.sanitize = False
+        return True
+
+
 def sanitize_log_data(data: Any, max_length: int = 200) -> str:
     """
     Sanitize data for logging by removing sensitive information and limiting length.
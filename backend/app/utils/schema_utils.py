@@ -0,0 +1,145 @@
+"""
+Schema construction helpers for the Performance Management System.
+
+Provides a fast path for rendering trusted ORM rows as JSON responses: rows
+are dumped straight to plain dicts shaped like the response model, skipping
+re-validation of data the database has already typed.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Tuple, Type, Union, get_args, get_origin
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+
+
+_MISSING = object()
+
+
+def strict_response_validation() -> bool:
+    """
+    Whether handlers must fully validate their responses.
+
+    Set STRICT_RESPONSE_VALIDATION (e.g. in tests) to route trusted ORM rows
+    through the pydantic validators instead of the construct/dump fast paths
+    below. This is the only place the setting is read.
+    """
+    return bool(getattr(settings, "STRICT_RESPONSE_VALIDATION", False))
+
+
+def _as_model(annotation: Any):
+    """Return the BaseModel subclass for an annotation, if it is one."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+@lru_cache(maxsize=None)
+def _field_plan(model: Type[BaseModel]) -> Tuple[Tuple[str, Any, bool], ...]:
+    """
+    Precompute (field_name, nested_model, is_list) for every field of `model`.
+
+    Cached per model class so the annotation inspection happens once per
+    process rather than once per row.
+    """
+    plan = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        origin = get_origin(annotation)
+
+        # Unwrap Optional[X] -> X
+        if origin is Union:
+            non_none = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(non_none) == 1:
+                annotation = non_none[0]
+                origin = get_origin(annotation)
+
+        nested, many = _as_model(annotation), False
+        if nested is None and origin in (list, List):
+            args = get_args(annotation)
+            nested = _as_model(args[0]) if args else None
+            many = nested is not None
+
+        plan.append((name, nested, many))
+    return tuple(plan)
+
+
+def dump_from_orm(model: Type[BaseModel], obj: Any) -> dict:
+    """
+    Build a plain dict shaped like `model` straight from an ORM object.
+
+    For handlers that return a JSON response directly: no model instance is
+    created at all, so neither validation nor FastAPI's response_model
+    round-trip runs. Values must already be JSON-serializable.
+
+    Args:
+        model: Pydantic model class describing the output shape
+        obj: Trusted ORM instance (or any attribute-bearing object)
+
+    Returns:
+        dict: Field name -> value, with nested models as dicts
+    """
+    data = {}
+    for name, nested, many in _field_plan(model):
+        value = getattr(obj, name, _MISSING)
+        if value is _MISSING:
+            field = model.model_fields[name]
+            if field.is_required():
+                continue
+            value = field.get_default(call_default_factory=True)
+        elif nested is not None and value is not None:
+            if many:
+                value = [dump_from_orm(nested, item) for item in value]
+            else:
+                value = dump_from_orm(nested, value)
+        data[name] = value
+    return data
+
+
+def validated_json(adapter: TypeAdapter, rows: Any, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """
+    Validate ORM row(s) once and return them as a ready JSON response.
+
+    Returning a Response makes FastAPI skip its response_model round-trip
+    (dump + re-validate + jsonable_encoder); response_model stays on the
+    routes for the OpenAPI schema only. Fields are dumped by alias, as
+    FastAPI's own response serialization does.
+
+    Args:
+        adapter: TypeAdapter for the response shape (a model or a list of them)
+        rows: ORM instance(s) or plain data matching the adapter
+        status_code: HTTP status of the response
+
+    Returns:
+        ORJSONResponse: The serialized, validated payload
+    """
+    validated = adapter.validate_python(rows, from_attributes=True)
+    return ORJSONResponse(adapter.dump_python(validated, mode="json", by_alias=True), status_code=status_code)
+
+
+def orm_response(
+    model: Type[BaseModel],
+    adapter: TypeAdapter,
+    obj: Any,
+    status_code: int = status.HTTP_200_OK
+) -> ORJSONResponse:
+    """
+    Render one trusted ORM row as a ready JSON response.
+
+    The row is dumped straight to a plain dict for orjson (see `dump_from_orm`);
+    with STRICT_RESPONSE_VALIDATION it is validated once through `adapter`
+    instead. Either way FastAPI's response_model round-trip is skipped.
+    """
+    if strict_response_validation():
+        return validated_json(adapter, obj, status_code)
+    return ORJSONResponse(dump_from_orm(model, obj), status_code=status_code)
+
+
+def orm_list_response(model: Type[BaseModel], adapter: TypeAdapter, rows: List[Any]) -> ORJSONResponse:
+    """Render trusted ORM rows for a list endpoint, like `orm_response` does for one row."""
+    if strict_response_validation():
+        return validated_json(adapter, rows)
+    return ORJSONResponse([dump_from_orm(model, row) for row in rows])
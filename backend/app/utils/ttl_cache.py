@@ -0,0 +1,65 @@
+"""Small in-process TTL cache.
+
+Used for read-mostly data that is expensive to recompute per request:
+rendered list responses whose data only changes through a handful of write
+endpoints (writers call `clear()` after they commit), and verified JWT claims
+(entries never outlive the token's own `exp`).
+
+Like the rate limiter this is memory-backed and per-process: other workers only
+see a write once their own entries expire, so keep the TTL short.
+"""
+from collections import OrderedDict
+import time
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded LRU mapping of key -> value where every entry expires after a TTL.
+
+    All operations are synchronous and never await, so they are atomic with
+    respect to other coroutines on the event loop and need no lock.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 30):
+        self.maxsize = maxsize
+        self.ttl = ttl_seconds
+        self._store: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for `key`, or None if absent or expired."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._store[key]
+            return None
+
+        self._store.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """Cache `value` for `key` for the configured TTL.
+
+        `expires_at` is an optional wall-clock (epoch seconds) deadline, e.g. a
+        JWT `exp`; the entry then expires at whichever comes first.
+        """
+        ttl = self.ttl
+        if expires_at is not None:
+            ttl = min(ttl, float(expires_at) - time.time())
+            if ttl <= 0:
+                return
+
+        self._store[key] = (time.monotonic() + ttl, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the entry for `key`, if any."""
+        self._store.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._store.clear()
@@ -6,7 +6,7 @@ exception handling, routing, and static file serving.
 """
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from fastapi.staticfiles import StaticFiles
@@ -17,6 +17,7 @@ from starlette.requests import Request
 from starlette.responses import HTMLResponse
 from starlette.exceptions import HTTPException
 from dotenv import load_dotenv
+import asyncio
 
 # Load environment variables from .env file BEFORE anything else
 env_file = f".env.{os.getenv('APP_ENV', 'development')}"
@@ -30,9 +31,10 @@ from app.db.database import engine, Base
 from app.routers import employees, appraisals, goals, appraisal_types, appraisal_goals, frontend_serve, roles, auth_router, goal_template_headers, microsoft_auth, application_roles
 from app.core.config import settings
 from app.core.exception_handlers import setup_exception_handlers
-from app.db.database import init_db, close_db
+from app.db.database import init_db, close_db, warm_db_pool
 from app.middleware.cors import setup_cors
 from app.middleware.request_logger import log_requests_middleware
+from app.middleware.db_session import db_session_middleware
 from app.constants import (
     NOT_FOUND, UNAUTHORIZED_HTTP, FORBIDDEN, VALIDATION_ERROR,
     FILE_NOT_FOUND, API_ENDPOINT_NOT_FOUND, ROUTE_NOT_FOUND,
@@ -48,6 +50,9 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager with logging."""
     logger.info("Application startup initiated")
+
+    # Strong references for fire-and-forget tasks (e.g. emails) so they are not GC'd mid-flight
+    app.state.bg_tasks = set()
     
     try:
         await init_db()
@@ -55,11 +60,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
         raise
+
+    try:
+        await warm_db_pool()
+    except Exception as e:
+        # A cold pool only costs first-request latency; don't block startup on it
+        logger.warning(f"Database pool warm-up failed: {str(e)}")
     
     logger.info("Application startup completed")
     yield
     
     logger.info("Application shutdown initiated")
+
+    if app.state.bg_tasks:
+        logger.info(f"Waiting for {len(app.state.bg_tasks)} background task(s) to finish")
+        await asyncio.gather(*app.state.bg_tasks, return_exceptions=True)
+
     try:
         await close_db()
         logger.info("Database connections closed successfully")
@@ -83,6 +99,9 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    # orjson serializes response models several times faster than stdlib json;
+    # routers that set their own default_response_class keep it
+    default_response_class=ORJSONResponse,
     root_path=settings.BASE_PATH if settings.BASE_PATH != "/" else "",
     docs_url="/docs",
     redoc_url="/redoc",
@@ -100,6 +119,10 @@ setup_cors(app)
 # always added to responses even if logging middleware raises an error.
 app.middleware("http")(log_requests_middleware)
 
+# One database session/transaction per API request, shared by every get_db
+# dependency; registered last so it wraps the logger
+app.middleware("http")(db_session_middleware)
+
 # Include API routers with proper versioning and organization
 api_prefix = "/api"
 
@@ -259,7 +282,7 @@ async def api_info():
             "Employee Management"
         ],
         "endpoints": {
-            "authentication": "/api/employees/login",
+            "authentication": "/api/auth/login",
             "employees": "/api/employees",
             "appraisals": "/api/appraisals",
             "goals": "/api/goals",
@@ -272,3 +295,8 @@ async def api_info():
             "openapi": "/openapi.json"
         }
     }
+
+
+# Built frontend files and the SPA fallback. Mounted last so every API, docs
+# and system route above takes precedence over the "/" catch-all.
+app.mount("/", frontend_serve.spa_files, name="spa")
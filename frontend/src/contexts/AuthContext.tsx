@@ -104,7 +104,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
       const refreshRes = await apiFetch<{
         access_token: string;
         refresh_token: string;
-      }>("/employees/refresh", {
+      }>("/auth/refresh", {
         method: "POST",
         body: JSON.stringify({ refresh_token: refreshToken }),
         headers: { "Content-Type": "application/json" },
@@ -171,10 +171,11 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
       const loginRes = await apiFetch<{
         access_token: string;
         refresh_token: string;
-      }>("/employees/login", {
+      }>("/auth/login", {
         method: "POST",
-        body: JSON.stringify({ email, password }),
-        headers: { "Content-Type": "application/json" },
+        // OAuth2 password flow: form-encoded, with the email as `username`
+        body: new URLSearchParams({ username: email, password }).toString(),
+        headers: { "Content-Type": "application/x-www-form-urlencoded" },
       });
       if (
         !loginRes.ok ||
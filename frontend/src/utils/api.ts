@@ -202,7 +202,7 @@ async function refreshTokens(): Promise<boolean> {
   if (!refreshToken) return false;
 
   try {
-    const response = await fetch(`${getApiBaseUrl()}/api/employees/refresh`, {
+    const response = await fetch(`${getApiBaseUrl()}/api/auth/refresh`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
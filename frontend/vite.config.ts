@@ -1,8 +1,57 @@
 import { defineConfig } from 'vite'
+import type { Plugin } from 'vite'
 import react from '@vitejs/plugin-react'
 
 import tailwindcss from '@tailwindcss/vite'
+import { readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs'
+import { extname, join, resolve } from 'node:path'
 import { fileURLToPath, URL } from 'node:url'
+import { brotliCompressSync, constants as zlib, gzipSync } from 'node:zlib'
+
+// Text-like build output is written next to the original as .br/.gz once, at
+// build time, so the backend (app/routers/frontend_serve.py) serves it
+// compressed without compressing per request or at worker startup. Binary
+// formats (images, woff2, wasm) are already compressed and are left alone.
+const COMPRESSIBLE_EXTENSIONS = new Set([
+  '.js', '.mjs', '.css', '.html', '.svg', '.json', '.map', '.txt', '.webmanifest',
+])
+const PRECOMPRESS_MAX_BYTES = 10 * 1024 * 1024
+
+function precompress(): Plugin {
+  let outDir = 'dist'
+
+  const walk = (dir: string) => {
+    for (const entry of readdirSync(dir, { withFileTypes: true })) {
+      const path = join(dir, entry.name)
+      if (entry.isDirectory()) {
+        walk(path)
+        continue
+      }
+      if (!COMPRESSIBLE_EXTENSIONS.has(extname(entry.name).toLowerCase())) continue
+      if (statSync(path).size > PRECOMPRESS_MAX_BYTES) continue
+
+      const data = readFileSync(path)
+      writeFileSync(`${path}.gz`, gzipSync(data, { level: 9 }))
+      writeFileSync(`${path}.br`, brotliCompressSync(data, {
+        params: {
+          [zlib.BROTLI_PARAM_MODE]: zlib.BROTLI_MODE_TEXT,
+          [zlib.BROTLI_PARAM_QUALITY]: zlib.BROTLI_MAX_QUALITY,
+        },
+      }))
+    }
+  }
+
+  return {
+    name: 'precompress',
+    apply: 'build',
+    configResolved(config) {
+      outDir = resolve(config.root, config.build.outDir)
+    },
+    closeBundle() {
+      walk(outDir)
+    },
+  }
+}
 
 // https://vite.dev/config/
 export default defineConfig(({ mode }) => {
@@ -11,7 +60,7 @@ export default defineConfig(({ mode }) => {
   const apiTarget = mode === 'test' ? 'http://localhost:7001' : 'http://localhost:5000';
 
   return {
-    plugins: [react(), tailwindcss()],
+    plugins: [react(), tailwindcss(), precompress()],
     resolve: {
       alias: {
         '@': fileURLToPath(new URL('./src', import.meta.url)),